@@ -14,12 +14,11 @@ if config.config_file_name is not None:
 
 
 def _get_url() -> str:
-    return (
-        "postgresql+psycopg://"
-        f"{settings.REFLECTIONS_DB_USER}:{settings.REFLECTIONS_DB_PASSWORD}"
-        f"@{settings.REFLECTIONS_DB_HOST}:{settings.REFLECTIONS_DB_PORT}"
-        f"/{settings.REFLECTIONS_DB_NAME}"
-    )
+    return settings.database_dsn
+
+
+def _include_object(obj, name, type_, reflected, compare_to) -> bool:  # type: ignore[no-untyped-def]
+    return not (type_ == "table" and name and name.startswith("pg_"))
 
 
 def run_migrations_offline() -> None:
@@ -45,7 +44,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection)
+        context.configure(
+            connection=connection,
+            # Only reflect the default schema, and skip catalog-ish tables,
+            # so `alembic revision --autogenerate` doesn't walk everything.
+            include_schemas=False,
+            include_object=_include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -7,8 +7,6 @@ Create Date: 2025-12-12
 
 from __future__ import annotations
 
-from alembic import op
-
 revision = "0002_memory_id_uuid"
 down_revision = "0001_memory_vector_tables"
 branch_labels = None
@@ -16,9 +14,11 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Convert id from text -> uuid (UUIDv7 string values are valid UUIDs).
-    op.execute("ALTER TABLE memory_items ALTER COLUMN id TYPE uuid USING id::uuid;")
+    # The id text -> uuid conversion now happens in 0003 alongside user_id and
+    # avatar_id (one backfill pass + one swap for all three columns). Kept as
+    # a no-op so existing revision chains still resolve.
+    pass
 
 
 def downgrade() -> None:
-    op.execute("ALTER TABLE memory_items ALTER COLUMN id TYPE text USING id::text;")
+    pass
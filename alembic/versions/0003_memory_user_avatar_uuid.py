@@ -1,4 +1,4 @@
-"""memory_items user_id/avatar_id to UUID
+"""memory_items id/user_id/avatar_id to UUID
 
 Revision ID: 0003_memory_user_avatar_uuid
 Revises: 0002_memory_id_uuid
@@ -7,29 +7,157 @@ Create Date: 2025-12-12
 
 from __future__ import annotations
 
-from alembic import op
+import os
+
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+from alembic import context, op
 
 revision = "0003_memory_user_avatar_uuid"
 down_revision = "0002_memory_id_uuid"
 branch_labels = None
 depends_on = None
 
+# Rows converted per backfill transaction. Override for very large tables.
+BATCH_SIZE = int(os.environ.get("REFLECTIONS_MIGRATION_BATCH_SIZE", "10000"))
+
 
 def upgrade() -> None:
+    # Add-backfill-swap instead of an in-place ALTER COLUMN ... TYPE: an
+    # in-place type change rewrites the whole heap under ACCESS EXCLUSIVE,
+    # blocking readers for the duration. Here the table stays readable while
+    # short batches backfill the new columns; only the final swap locks.
+    # (UUIDv7 string values are valid UUIDs; re-casting an already-uuid
+    # column is harmless.) Every step is idempotent so a migration that died
+    # half-way can simply be re-run.
+    op.execute(
+        "ALTER TABLE memory_items "
+        "ADD COLUMN IF NOT EXISTS id_new uuid, "
+        "ADD COLUMN IF NOT EXISTS user_id_new uuid, "
+        "ADD COLUMN IF NOT EXISTS avatar_id_new uuid;"
+    )
+    # Dual-write: rows inserted or updated while the backfill runs get their
+    # new columns filled in by the trigger, so nothing is left behind for the
+    # swap. Committed together with the ADD COLUMNs (whose lock keeps writers
+    # out until then) before the backfill starts.
     op.execute(
-        "ALTER TABLE memory_items ALTER COLUMN user_id TYPE uuid USING user_id::uuid;"
+        "CREATE OR REPLACE FUNCTION memory_items_uuid_sync() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ BEGIN "
+        "NEW.id_new := NEW.id::uuid; "
+        "NEW.user_id_new := NEW.user_id::uuid; "
+        "NEW.avatar_id_new := NEW.avatar_id::uuid; "
+        "RETURN NEW; END $$;"
     )
     op.execute(
-        "ALTER TABLE memory_items ALTER COLUMN avatar_id TYPE uuid USING "
-        "avatar_id::uuid;"
+        "CREATE OR REPLACE TRIGGER memory_items_uuid_sync "
+        "BEFORE INSERT OR UPDATE ON memory_items "
+        "FOR EACH ROW EXECUTE FUNCTION memory_items_uuid_sync();"
     )
 
+    # Each batch is one set-based statement: the new values are derived
+    # server-side from the old columns, so nothing round-trips through the
+    # client (no per-row UPDATEs, nothing to COPY in). Batches walk the
+    # primary key on its native type (keyset), so each one is a range scan
+    # of memory_items_pkey whether id is still text or already uuid.
+    set_new = (
+        "UPDATE memory_items m "
+        "SET id_new = m.id::uuid, "
+        "user_id_new = m.user_id::uuid, "
+        "avatar_id_new = m.avatar_id::uuid "
+    )
 
-def downgrade() -> None:
+    def backfill(keyset: str) -> sa.TextClause:
+        return sa.text(
+            "WITH batch AS ("
+            f"SELECT id FROM memory_items {keyset}ORDER BY id LIMIT :batch_size"
+            f"), upd AS ({set_new}FROM batch WHERE m.id = batch.id) "
+            "SELECT id FROM batch ORDER BY id DESC LIMIT 1"
+        )
+
+    first, following = backfill(""), backfill("WHERE id > :after ")
+    # Commit each batch so row locks and WAL are released as we go.
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            # --sql can't read batch results back; emit one set-based pass
+            # (the sync trigger covers writes made while it runs).
+            op.execute(set_new + "WHERE m.id_new IS NULL;")
+        else:
+            bind = op.get_bind()
+            last = bind.execute(first, {"batch_size": BATCH_SIZE}).scalar()
+            while last is not None:
+                last = bind.execute(
+                    following, {"after": last, "batch_size": BATCH_SIZE}
+                ).scalar()
+
+        # Everything the swap needs is prepared here without blocking
+        # writers: the future primary key and the (user_id, avatar_id, kind)
+        # index are built CONCURRENTLY, and NOT NULL is proven by validated
+        # CHECKs (VALIDATE only takes SHARE UPDATE EXCLUSIVE). With those in
+        # place SET NOT NULL and ADD PRIMARY KEY USING INDEX skip their
+        # full-table scans under the swap's ACCESS EXCLUSIVE lock.
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS memory_items_id_new_key "
+            "ON memory_items (id_new);"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS memory_items_user_avatar_kind_new "
+            "ON memory_items (user_id_new, avatar_id_new, kind);"
+        )
+        op.execute(
+            "ALTER TABLE memory_items "
+            "DROP CONSTRAINT IF EXISTS memory_items_id_new_not_null, "
+            "DROP CONSTRAINT IF EXISTS memory_items_user_id_new_not_null, "
+            "ADD CONSTRAINT memory_items_id_new_not_null "
+            "CHECK (id_new IS NOT NULL) NOT VALID, "
+            "ADD CONSTRAINT memory_items_user_id_new_not_null "
+            "CHECK (user_id_new IS NOT NULL) NOT VALID;"
+        )
+        op.execute(
+            "ALTER TABLE memory_items "
+            "VALIDATE CONSTRAINT memory_items_id_new_not_null;"
+        )
+        op.execute(
+            "ALTER TABLE memory_items "
+            "VALIDATE CONSTRAINT memory_items_user_id_new_not_null;"
+        )
+
+    # Swap, in the migration transaction: metadata-only changes under a brief
+    # lock. Dropping user_id takes the old (user_id, avatar_id, kind) index
+    # with it; the one built above takes over its name.
+    op.execute("DROP TRIGGER IF EXISTS memory_items_uuid_sync ON memory_items;")
+    op.execute("DROP FUNCTION IF EXISTS memory_items_uuid_sync();")
     op.execute(
-        "ALTER TABLE memory_items ALTER COLUMN user_id TYPE text USING user_id::text;"
+        "ALTER TABLE memory_items "
+        "DROP CONSTRAINT memory_items_pkey, "
+        "DROP COLUMN id, "
+        "DROP COLUMN user_id, "
+        "DROP COLUMN avatar_id;"
     )
+    op.execute("ALTER TABLE memory_items RENAME COLUMN id_new TO id;")
+    op.execute("ALTER TABLE memory_items RENAME COLUMN user_id_new TO user_id;")
+    op.execute("ALTER TABLE memory_items RENAME COLUMN avatar_id_new TO avatar_id;")
+    op.execute(
+        "ALTER INDEX memory_items_user_avatar_kind_new "
+        "RENAME TO memory_items_user_avatar_kind;"
+    )
+    op.execute(
+        "ALTER TABLE memory_items "
+        "ALTER COLUMN id SET NOT NULL, "
+        "ALTER COLUMN user_id SET NOT NULL, "
+        "ADD CONSTRAINT memory_items_pkey "
+        "PRIMARY KEY USING INDEX memory_items_id_new_key;"
+    )
+    op.execute(
+        "ALTER TABLE memory_items "
+        "DROP CONSTRAINT memory_items_id_new_not_null, "
+        "DROP CONSTRAINT memory_items_user_id_new_not_null;"
+    )
+
+
+def downgrade() -> None:
     op.execute(
-        "ALTER TABLE memory_items ALTER COLUMN avatar_id TYPE text USING "
-        "avatar_id::text;"
+        "ALTER TABLE memory_items "
+        "ALTER COLUMN id TYPE text USING id::text, "
+        "ALTER COLUMN user_id TYPE text USING user_id::text, "
+        "ALTER COLUMN avatar_id TYPE text USING avatar_id::text;"
     )
@@ -7,8 +7,6 @@ Create Date: 2025-12-14
 
 from __future__ import annotations
 
-import sqlalchemy as sa  # type: ignore[import-not-found]
-
 from alembic import op
 
 revision = "0005_auth_user_name"
@@ -18,18 +16,13 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Default to empty string so existing rows can be migrated without NULLs.
-    op.add_column(
-        "users",
-        sa.Column(
-            "name",
-            sa.Text(),
-            nullable=False,
-            server_default="",
-        ),
-    )
-    # Drop the default going forward; application should set name explicitly.
-    op.alter_column("users", "name", server_default=None)
+    # Empty-string default backfills existing rows without NULLs, then is
+    # dropped so the application must set name explicitly. On PG >= 11 a
+    # constant default is metadata-only, so neither step rewrites the table.
+    # Two statements: within one ALTER TABLE, Postgres runs DROP DEFAULT
+    # before ADD COLUMN, so the column wouldn't exist yet.
+    op.execute("ALTER TABLE users ADD COLUMN name text NOT NULL DEFAULT '';")
+    op.execute("ALTER TABLE users ALTER COLUMN name DROP DEFAULT;")
 
 
 def downgrade() -> None:
@@ -0,0 +1,115 @@
+"""sessions: single covering unique index on token_hash
+
+Revision ID: 0016_sessions_token_covering
+Revises: 0015_memory_content_tsv
+Create Date: 2026-10-16
+
+0004 created both `sessions_token_hash_unique (token_hash)` and
+`sessions_active_lookup_idx (token_hash, revoked_at, expires_at)`. Both
+lead with token_hash, so every session insert/revoke paid for two b-trees
+while lookups only ever needed one. Replace them with a single unique
+index on token_hash that INCLUDEs the columns the active-session probe
+reads, so the per-request auth lookup can be an index-only scan.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+from alembic import context, op
+
+revision = "0016_sessions_token_covering"
+down_revision = "0015_memory_content_tsv"
+branch_labels = None
+depends_on = None
+
+
+def _index_valid(name: str) -> bool | None:
+    """pg_index.indisvalid for the named index; None if it doesn't exist."""
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+            ),
+            {"name": name},
+        )
+        .scalar_one_or_none()
+    )
+
+
+def _create_valid_index(name: str, create: Callable[[], None]) -> None:
+    # A CONCURRENTLY build that failed earlier leaves an INVALID index under
+    # this name, which IF NOT EXISTS would silently keep. Rebuild it, and stop
+    # before anything is dropped if the new index still isn't usable.
+    # (Offline --sql runs can't read the catalog; they just emit the DDL.)
+    offline = context.is_offline_mode()
+    if not offline and _index_valid(name) is False:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+    create()
+    if not offline and not _index_valid(name):
+        raise RuntimeError(f"index {name} is missing or INVALID; old indexes kept")
+
+
+def upgrade() -> None:
+    # sessions is written on every login; build/drop CONCURRENTLY (outside
+    # the migration transaction) so logins and auth lookups keep flowing.
+    with op.get_context().autocommit_block():
+        _create_valid_index(
+            "sessions_token_hash_active_idx",
+            lambda: op.create_index(
+                "sessions_token_hash_active_idx",
+                "sessions",
+                ["token_hash"],
+                unique=True,
+                postgresql_include=["revoked_at", "expires_at", "user_id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            ),
+        )
+        op.drop_index(
+            "sessions_active_lookup_idx",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "sessions_token_hash_unique",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _create_valid_index(
+            "sessions_token_hash_unique",
+            lambda: op.create_index(
+                "sessions_token_hash_unique",
+                "sessions",
+                ["token_hash"],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            ),
+        )
+        _create_valid_index(
+            "sessions_active_lookup_idx",
+            lambda: op.create_index(
+                "sessions_active_lookup_idx",
+                "sessions",
+                ["token_hash", "revoked_at", "expires_at"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            ),
+        )
+        op.drop_index(
+            "sessions_token_hash_active_idx",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,34 @@
+"""server-side UUIDv7 defaults on auth/avatar/conversation ids
+
+Revision ID: 0017_uuid_server_defaults
+Revises: 0016_sessions_token_covering
+Create Date: 2026-10-16
+
+Postgres 18 ships a native `uuidv7()`, so the database can mint the
+time-ordered ids we standardize on (see commons/ids.py) instead of every
+insert path generating one in Python and shipping it over the wire.
+Rows that need their id come back via `INSERT ... RETURNING`.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+from alembic import op
+
+revision = "0017_uuid_server_defaults"
+down_revision = "0016_sessions_token_covering"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("users", "sessions", "avatars", "conversations", "conversation_turns")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuidv7()"))
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,72 @@
+"""users.email: stored lower-cased, looked up via users_email_unique
+
+Revision ID: 0020_users_email_lowercase
+Revises: 0018_sessions_token_hash_bytea
+Create Date: 2026-10-16
+
+get_user_by_email compares User.email == email.lower() so the login lookup
+is a plain probe of the existing unique btree (users_email_unique) instead
+of evaluating lower(email) per row. That is only correct if every stored
+email is already lower-case, so normalise stragglers and pin it with a
+CHECK constraint.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+from alembic import context, op
+
+revision = "0020_users_email_lowercase"
+down_revision = "0018_sessions_token_hash_bytea"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lower-casing two accounts that differ only by case would trip
+    # users_email_unique half-way through the UPDATE; refuse up front and
+    # name them so an operator can merge or rename one by hand. Offline
+    # (--sql) runs can't read results, so the script carries the check.
+    if context.is_offline_mode():
+        op.execute(
+            "DO $$ BEGIN IF EXISTS (SELECT 1 FROM users GROUP BY lower(email) "
+            "HAVING count(*) > 1) THEN RAISE EXCEPTION "
+            "'users.email differs only by case; resolve before migrating'; "
+            "END IF; END $$;"
+        )
+    else:
+        collisions = (
+            op.get_bind()
+            .execute(
+                sa.text(
+                    "SELECT lower(email) FROM users "
+                    "GROUP BY lower(email) HAVING count(*) > 1 ORDER BY 1"
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if collisions:
+            raise RuntimeError(
+                "users.email differs only by case for: "
+                + ", ".join(collisions)
+                + ". Resolve these accounts before running this migration."
+            )
+
+    # insert_user already lower-cases; this only catches rows written by hand.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email);")
+    # The NOT VALID add is catalog-only. VALIDATE then runs in its own
+    # transaction: inside the migration transaction it would still sit behind
+    # the ACCESS EXCLUSIVE lock the ADD took, blocking logins for the scan.
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT users_email_lowercase "
+        "CHECK (email = lower(email)) NOT VALID;"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE users VALIDATE CONSTRAINT users_email_lowercase;")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS users_email_unique ON users (email);")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_lowercase;")
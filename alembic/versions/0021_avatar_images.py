@@ -0,0 +1,68 @@
+"""avatar_images: generated avatar images stored as raw bytes
+
+Revision ID: 0021_avatar_images
+Revises: 0020_users_email_lowercase
+Create Date: 2026-10-16
+
+Generated images used to live inline in avatars.image_url as base64 data
+URLs (+33% size, re-sent in every avatar list). They are now stored once as
+bytea and served as binary from GET /avatars/{id}/image; image_url just
+points there.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+from alembic import op
+
+revision = "0021_avatar_images"
+down_revision = "0020_users_email_lowercase"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "avatar_images",
+        sa.Column(
+            "avatar_id",
+            sa.Uuid(),
+            sa.ForeignKey("avatars.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("content_type", sa.Text(), nullable=False),
+        # Already-compressed PNG/WEBP: skip TOAST's pglz pass.
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.execute("ALTER TABLE avatar_images ALTER COLUMN data SET STORAGE EXTERNAL;")
+
+    # Move existing data-URL images over: decode server-side into bytea, then
+    # point image_url at the binary endpoint (same shape as _image_path).
+    op.execute(
+        "INSERT INTO avatar_images (avatar_id, content_type, data) "
+        "SELECT id, split_part(substr(image_url, 6), ';', 1), "
+        "decode(split_part(image_url, ',', 2), 'base64') "
+        "FROM avatars WHERE image_url LIKE 'data:%;base64,%';"
+    )
+    op.execute(
+        "UPDATE avatars SET image_url = '/avatars/' || id || '/image?v=' "
+        "|| (extract(epoch FROM now()) * 1000)::bigint "
+        "WHERE image_url LIKE 'data:%;base64,%';"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE avatars a SET image_url = 'data:' || i.content_type || ';base64,' "
+        "|| translate(encode(i.data, 'base64'), E'\\n', '') "
+        "FROM avatar_images i WHERE i.avatar_id = a.id;"
+    )
+    op.drop_table("avatar_images")
@@ -0,0 +1,83 @@
+"""memory_items: HNSW over half-precision embeddings
+
+Revision ID: 0022_memory_halfvec_hnsw
+Revises: 0021_avatar_images
+Create Date: 2026-10-16
+
+The vector leg of recall walks the HNSW graph over 384-dim fp32 vectors
+(1536 bytes each). An expression index on embedding::halfvec(384) stores
+them at 2 bytes per dimension, halving index size and the memory traffic
+of each scan. The repository searches this index for an oversampled
+candidate set and re-scores it against the full-precision column, so the
+final ranking is unchanged for practical purposes. The fp32 HNSW index
+from 0001 is no longer used by any query and is dropped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+from alembic import context, op
+
+revision = "0022_memory_halfvec_hnsw"
+down_revision = "0021_avatar_images"
+branch_labels = None
+depends_on = None
+
+
+def _index_valid(name: str) -> bool | None:
+    """pg_index.indisvalid for the named index; None if it doesn't exist."""
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+            ),
+            {"name": name},
+        )
+        .scalar_one_or_none()
+    )
+
+
+def _create_valid_index(name: str, create: Callable[[], None]) -> None:
+    # Same guard as 0016: rebuild an INVALID leftover from a failed
+    # CONCURRENTLY build instead of keeping it via IF NOT EXISTS, and stop
+    # before the old index is dropped if the new one still isn't usable.
+    offline = context.is_offline_mode()
+    if not offline and _index_valid(name) is False:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+    create()
+    if not offline and not _index_valid(name):
+        raise RuntimeError(f"index {name} is missing or INVALID; old indexes kept")
+
+
+def upgrade() -> None:
+    # Ingest writes here on every voice turn; build/drop CONCURRENTLY
+    # (outside the migration transaction) so writers aren't blocked.
+    with op.get_context().autocommit_block():
+        _create_valid_index(
+            "memory_items_embedding_halfvec_hnsw_ip",
+            lambda: op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "memory_items_embedding_halfvec_hnsw_ip ON memory_items "
+                "USING hnsw ((embedding::halfvec(384)) halfvec_ip_ops);"
+            ),
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS memory_items_embedding_hnsw_ip;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _create_valid_index(
+            "memory_items_embedding_hnsw_ip",
+            lambda: op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "memory_items_embedding_hnsw_ip "
+                "ON memory_items USING hnsw (embedding vector_ip_ops);"
+            ),
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS memory_items_embedding_halfvec_hnsw_ip;"
+        )
@@ -15,6 +15,13 @@ function apiBase(): string {
     return process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 }
 
+// Generated images are served by the API (GET /avatars/{id}/image) and
+// image_url holds a path relative to it; user-supplied URLs pass through.
+export function avatarImageSrc(url: string | null | undefined): string | null {
+    if (!url) return null;
+    return url.startsWith("/") ? `${apiBase()}${url}` : url;
+}
+
 export async function avatarsList(): Promise<{
     items: Avatar[];
     active_avatar_id: string | null;
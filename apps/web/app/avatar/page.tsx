@@ -6,6 +6,7 @@ import { useEffect, useState } from "react";
 import { LuminaTopBar } from "../_components/LuminaTopBar";
 import { authMe, type AuthUser } from "../_lib/auth";
 import {
+  avatarImageSrc,
   avatarsCreate,
   avatarsDelete,
   avatarsGenerateImage,
@@ -508,7 +509,7 @@ export default function AvatarPage() {
                 ) : active?.image_url ? (
                   // eslint-disable-next-line @next/next/no-img-element
                   <img
-                    src={active.image_url}
+                    src={avatarImageSrc(active.image_url) ?? undefined}
                     alt={active.name}
                     style={{ width: "100%", borderRadius: 10 }}
                   />
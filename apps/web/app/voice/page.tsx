@@ -8,7 +8,7 @@ import { useEffect, useRef, useState } from "react";
 import { LuminaTopBar } from "../_components/LuminaTopBar";
 import { TalkingAvatar } from "../_components/TalkingAvatar";
 import { authMe, type AuthUser } from "../_lib/auth";
-import { avatarsList, type Avatar } from "../_lib/avatars";
+import { avatarImageSrc, avatarsList, type Avatar } from "../_lib/avatars";
 import { conversationsRecent } from "../_lib/conversations";
 
 type ChatMessage = { role: "user" | "assistant" | "system"; text: string };
@@ -1090,7 +1090,7 @@ export default function VoicePage() {
           <div style={{ width: 260 }}>
             <TalkingAvatar
               name={activeAvatar?.name ?? "Lumina"}
-              imageUrl={activeAvatar?.image_url ?? null}
+              imageUrl={avatarImageSrc(activeAvatar?.image_url)}
               level={outputLevel}
               size={220}
             />
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette import status
 
 from reflections.commons.exceptions import (
@@ -10,20 +12,30 @@ from reflections.commons.exceptions import (
     BaseServiceUnProcessableException,
 )
 
+_STATUS_BY_EXCEPTION: dict[type[BaseServiceException], int] = {
+    BaseServiceNotFoundException: status.HTTP_404_NOT_FOUND,
+    BaseServiceUnProcessableException: status.HTTP_422_UNPROCESSABLE_CONTENT,
+}
+
+
+@lru_cache
+def _status_for(exc_type: type[BaseServiceException]) -> int:
+    # Walk the MRO once per concrete exception class; feature exceptions
+    # subclass the base types above.
+    for klass in exc_type.__mro__:
+        code = _STATUS_BY_EXCEPTION.get(klass)
+        if code is not None:
+            return code
+    return status.HTTP_400_BAD_REQUEST
+
 
 def configure_global_exception_handlers(app: FastAPI) -> FastAPI:
     @app.exception_handler(BaseServiceException)
     async def service_exception_handler(
         request: Request, exc: BaseServiceException
-    ) -> JSONResponse:
-        if isinstance(exc, BaseServiceNotFoundException):
-            code = status.HTTP_404_NOT_FOUND
-        elif isinstance(exc, BaseServiceUnProcessableException):
-            code = status.HTTP_422_UNPROCESSABLE_CONTENT
-        else:
-            code = status.HTTP_400_BAD_REQUEST
-
-        return JSONResponse(
+    ) -> ORJSONResponse:
+        code = _status_for(type(exc))
+        return ORJSONResponse(
             status_code=code,
             content={
                 "exception": {
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware  # type: ignore[import-not-found]
+from fastapi.responses import ORJSONResponse  # type: ignore[import-not-found]
 
 from reflections.api.exceptions import configure_global_exception_handlers
 from reflections.api.routers import configure_routers
+from reflections.avatars.a1111 import close_a1111_client
+from reflections.core.db import database_manager
 from reflections.core.settings import settings
+from reflections.health.repository import close_http_clients
 from reflections.mcp.server import mcp_http_app
 
 
@@ -14,23 +21,35 @@ def build_app() -> FastAPI:
     # adopt it so the MCP machinery starts/stops with the parent app.
     mcp_app = mcp_http_app()
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with mcp_app.router.lifespan_context(app):
+            await database_manager.initialize()
+            try:
+                yield
+            finally:
+                # Release pooled outbound HTTP clients and DB connections.
+                await close_a1111_client()
+                await close_http_clients()
+                await database_manager.shutdown()
+
     app = FastAPI(
         title=settings.API_TITLE,
         version=settings.API_VERSION,
-        lifespan=mcp_app.router.lifespan_context,
+        # orjson writes bytes directly (no intermediate str per key).
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     # CORS: be forgiving about localhost vs 127.0.0.1, since devs commonly use either.
-    raw_origins = [o.strip() for o in str(settings.CORS_ORIGINS).split(",") if o.strip()]
     origins: list[str] = []
-    for o in raw_origins:
+    for o in settings.cors_origins:
         origins.append(o)
         if o.startswith("http://localhost:"):
             origins.append(o.replace("http://localhost:", "http://127.0.0.1:", 1))
         elif o.startswith("http://127.0.0.1:"):
             origins.append(o.replace("http://127.0.0.1:", "http://localhost:", 1))
     # De-dupe while preserving order.
-    seen: set[str] = set()
-    origins = [o for o in origins if not (o in seen or seen.add(o))]
+    origins = list(dict.fromkeys(origins))
     if origins:
         app.add_middleware(
             CORSMiddleware,
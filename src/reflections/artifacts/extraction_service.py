@@ -47,7 +47,7 @@ from reflections.extractors.base import (
     UnsupportedArtifactError,
 )
 from reflections.extractors.dispatcher import dispatch as dispatch_extract
-from reflections.memory.service import MemoryService
+from reflections.memory.service import MemoryService, invalidate_recall_cache
 
 
 @dataclass
@@ -334,11 +334,9 @@ class ArtifactExtractionService:
         private: bool,
     ) -> list[UUID]:
         written: list[UUID] = []
-        for c in chunks:
-            text = (c.content or "").strip()
-            if not text:
-                continue
-            emb = self.memory.embed_text(text)
+        kept = [(c, text) for c in chunks if (text := (c.content or "").strip())]
+        embs = self.memory.embed_texts([text for _, text in kept])
+        for (c, text), emb in zip(kept, embs, strict=True):
             new_id = await self.memory.repository.insert_item(
                 session,
                 user_id=user_id,
@@ -354,6 +352,7 @@ class ArtifactExtractionService:
             )
             written.append(new_id)
         await session.commit()
+        invalidate_recall_cache(user_id)
         return written
 
     def _collect_attributes(
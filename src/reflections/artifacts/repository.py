@@ -772,9 +772,10 @@ class ArtifactsRepository:
             )
         )
         await session.execute(del_stmt)
+        ids = [uuid7_uuid() for _ in rules]
         for idx, rule in enumerate(rules):
             ins = sa.insert(extraction_policies_table).values(
-                id=uuid7_uuid(),
+                id=ids[idx],
                 user_id=user_id,
                 volume_id=volume_id,
                 position=int(rule.get("position", idx)),
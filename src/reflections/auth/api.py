@@ -32,16 +32,44 @@ from reflections.core.settings import settings
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+# Settings are fixed for the process lifetime; resolve the cookie attributes
+# once instead of on every signup/login.
+_SESSION_COOKIE_KWARGS: dict = {
+    "key": settings.AUTH_COOKIE_NAME,
+    "httponly": True,
+    "secure": bool(settings.AUTH_COOKIE_SECURE),
+    "samesite": str(settings.AUTH_COOKIE_SAMESITE),
+    "path": "/",
+    "max_age": int(settings.AUTH_SESSION_TTL_DAYS) * 24 * 60 * 60,
+}
+
+
 def _set_session_cookie(resp: Response, token: str) -> None:
-    resp.set_cookie(
-        key=settings.AUTH_COOKIE_NAME,
-        value=token,
-        httponly=True,
-        secure=bool(settings.AUTH_COOKIE_SECURE),
-        samesite=str(settings.AUTH_COOKIE_SAMESITE),
-        path="/",
-        max_age=int(settings.AUTH_SESSION_TTL_DAYS) * 24 * 60 * 60,
+    resp.set_cookie(value=token, **_SESSION_COOKIE_KWARGS)
+
+
+def _to_public(user) -> UserPublic:  # type: ignore[no-untyped-def]
+    return UserPublic(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        is_admin=user.is_admin,
+        active_avatar_id=user.active_avatar_id,
+        created_at=user.created_at,
+        last_login_at=user.last_login_at,
+    )
+
+
+def _auth_response(user, token: str) -> Response:  # type: ignore[no-untyped-def]
+    # model_dump_json emits bytes straight from pydantic-core; going through
+    # model_dump(mode="json") + JSONResponse walked every field twice.
+    resp = Response(
+        content=AuthResponse(user=_to_public(user)).model_dump_json(),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
     )
+    _set_session_cookie(resp, token)
+    return resp
 
 
 def _clear_session_cookie(resp: Response) -> None:
@@ -57,24 +85,11 @@ async def signup(
     request: Request,
     session: Annotated[AsyncSession, Depends(database_session)],
     svc: Annotated[AuthService, Depends(get_auth_service)],
-) -> JSONResponse:
+) -> Response:
     user, token = await svc.signup(
         session, email=str(req.email), name=req.name, password=req.password
     )
-    data = AuthResponse(
-        user=UserPublic(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            is_admin=user.is_admin,
-            active_avatar_id=user.active_avatar_id,
-            created_at=user.created_at,
-            last_login_at=user.last_login_at,
-        )
-    ).model_dump(mode="json")
-    resp = JSONResponse(status_code=status.HTTP_200_OK, content=data)
-    _set_session_cookie(resp, token)
-    return resp
+    return _auth_response(user, token)
 
 
 @router.post("/login", response_model=AuthResponse)
@@ -83,7 +98,7 @@ async def login(
     request: Request,
     session: Annotated[AsyncSession, Depends(database_session)],
     svc: Annotated[AuthService, Depends(get_auth_service)],
-) -> JSONResponse:
+) -> Response:
     # Map invalid creds to 401 (instead of generic 404 via BaseServiceNotFoundException).
     try:
         user, token = await svc.login(
@@ -95,20 +110,7 @@ async def login(
             detail=exc.details or "Invalid credentials",
         ) from exc
 
-    data = AuthResponse(
-        user=UserPublic(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            is_admin=user.is_admin,
-            active_avatar_id=user.active_avatar_id,
-            created_at=user.created_at,
-            last_login_at=user.last_login_at,
-        )
-    ).model_dump(mode="json")
-    resp = JSONResponse(status_code=status.HTTP_200_OK, content=data)
-    _set_session_cookie(resp, token)
-    return resp
+    return _auth_response(user, token)
 
 
 @router.post("/logout")
@@ -131,14 +133,4 @@ async def logout(
 async def me(
     user=Depends(current_user_required),
 ) -> AuthResponse:
-    return AuthResponse(
-        user=UserPublic(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            is_admin=user.is_admin,
-            active_avatar_id=user.active_avatar_id,
-            created_at=user.created_at,
-            last_login_at=user.last_login_at,
-        )
-    )
+    return AuthResponse(user=_to_public(user))
@@ -3,7 +3,9 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
+import os
 import secrets
+import threading
 
 
 def _b64e(raw: bytes) -> str:
@@ -15,6 +17,17 @@ def _b64d(s: str) -> bytes:
     return base64.urlsafe_b64decode((s + pad).encode("utf-8"))
 
 
+def _pbkdf2_sha256(password: str, salt: bytes, iterations: int, dklen: int) -> bytes:
+    # On Python >= 3.12 hashlib.pbkdf2_hmac is always OpenSSL's
+    # PKCS5_PBKDF2_HMAC (the pure-Python fallback was removed), so the inner
+    # HMAC-SHA256 loop already runs on OpenSSL's SHA-NI/AVX2 code paths where
+    # the CPU has them. Swapping in `cryptography`'s PBKDF2HMAC would call the
+    # same OpenSSL routine; argon2 would change the stored hash format.
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), salt, iterations, dklen=dklen
+    )
+
+
 def hash_password(password: str, *, iterations: int = 210_000) -> str:
     """
     PBKDF2-SHA256 password hash:
@@ -23,9 +36,7 @@ def hash_password(password: str, *, iterations: int = 210_000) -> str:
     if not password:
         raise ValueError("password must be non-empty")
     salt = secrets.token_bytes(16)
-    dk = hashlib.pbkdf2_hmac(
-        "sha256", password.encode("utf-8"), salt, iterations, dklen=32
-    )
+    dk = _pbkdf2_sha256(password, salt, iterations, 32)
     return f"pbkdf2_sha256${iterations}${_b64e(salt)}${_b64e(dk)}"
 
 
@@ -37,21 +48,56 @@ def verify_password(password: str, encoded: str) -> bool:
         iters = int(iters_s)
         salt = _b64d(salt_b64)
         expected = _b64d(hash_b64)
-        dk = hashlib.pbkdf2_hmac(
-            "sha256", password.encode("utf-8"), salt, iters, dklen=len(expected)
-        )
+        dk = _pbkdf2_sha256(password, salt, iters, len(expected))
         return hmac.compare_digest(dk, expected)
     except Exception:
         return False
 
 
+class _RandomPool:
+    """
+    Hands out slices of a 4 KiB os.urandom() block, refilling when drained.
+
+    Same entropy source as `secrets.token_urlsafe`, but one getrandom()
+    syscall per 128 session tokens instead of one per token.
+    """
+
+    def __init__(self, size: int = 4096) -> None:
+        self._size = size
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._offset = 0
+
+    def take(self, n: int) -> bytes:
+        with self._lock:
+            if self._offset + n > len(self._buf):
+                self._buf = os.urandom(self._size)
+                self._offset = 0
+            raw = self._buf[self._offset : self._offset + n]
+            self._offset += n
+            return raw
+
+    def reset(self) -> None:
+        # A forked child must never replay bytes the parent already handed out.
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._offset = 0
+
+
+_token_pool = _RandomPool()
+os.register_at_fork(after_in_child=_token_pool.reset)
+
+
 def new_session_token() -> str:
-    # Cookie value (opaque bearer token).
-    return secrets.token_urlsafe(32)
+    # Cookie value (opaque bearer token), same shape as secrets.token_urlsafe(32).
+    return _b64e(_token_pool.take(32))
 
 
-def hash_session_token(token: str) -> str:
+def hash_session_token(token: str) -> bytes:
     # Store only a hash in DB to reduce blast radius if DB is copied.
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    # Raw 32-byte digest (sessions.token_hash is bytea). Deliberately not
+    # memoized: a cache would keep raw bearer tokens alive in process memory,
+    # and one sha256 per request is negligible.
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Cookie, Depends, Request
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 
 from reflections.auth.service import AuthService
@@ -16,12 +16,19 @@ def get_auth_service() -> AuthService:
     return AuthService.create()
 
 
+# Read the session cookie straight off the request instead of declaring a
+# `Cookie(alias=...)` parameter, which FastAPI validates through a Pydantic
+# field on every request. (The AsyncSession below is lazy: no pool checkout
+# happens unless the token lookup actually runs a query.)
+_AUTH_COOKIE_NAME = settings.AUTH_COOKIE_NAME
+
+
 async def current_user_optional(
     request: Request,
     session: Annotated[AsyncSession, Depends(database_session)],
     svc: Annotated[AuthService, Depends(get_auth_service)],
-    token: str | None = Cookie(default=None, alias=settings.AUTH_COOKIE_NAME),
 ):
+    token = request.cookies.get(_AUTH_COOKIE_NAME)
     if not token:
         return None
     return await svc.get_user_for_session_token(session, token=token)
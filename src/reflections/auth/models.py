@@ -8,13 +8,19 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column  # type: ignor
 
 
 class Base(DeclarativeBase):
+    # Deliberately a plain DeclarativeBase: SQLAlchemy keeps instance state
+    # and loaded column values in each instance's __dict__, so mapped classes
+    # cannot use __slots__, and MappedAsDataclass alone would only swap in a
+    # generated __init__/__eq__ (which also makes instances unhashable).
     pass
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[UUID] = mapped_column(sa.Uuid(), primary_key=True)
+    id: Mapped[UUID] = mapped_column(
+        sa.Uuid(), primary_key=True, server_default=sa.text("uuidv7()")
+    )
     email: Mapped[str] = mapped_column(sa.Text(), nullable=False, unique=True)
     name: Mapped[str] = mapped_column(sa.Text(), nullable=False, default="")
     password_hash: Mapped[str] = mapped_column(sa.Text(), nullable=False)
@@ -40,11 +46,15 @@ class User(Base):
 class Session(Base):
     __tablename__ = "sessions"
 
-    id: Mapped[UUID] = mapped_column(sa.Uuid(), primary_key=True)
+    id: Mapped[UUID] = mapped_column(
+        sa.Uuid(), primary_key=True, server_default=sa.text("uuidv7()")
+    )
     user_id: Mapped[UUID] = mapped_column(
         sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    token_hash: Mapped[str] = mapped_column(sa.Text(), nullable=False, unique=True)
+    token_hash: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(32), nullable=False, unique=True
+    )
     created_at: Mapped[dt.datetime] = mapped_column(
         sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False
     )
@@ -61,7 +71,9 @@ class Session(Base):
 class Avatar(Base):
     __tablename__ = "avatars"
 
-    id: Mapped[UUID] = mapped_column(sa.Uuid(), primary_key=True)
+    id: Mapped[UUID] = mapped_column(
+        sa.Uuid(), primary_key=True, server_default=sa.text("uuidv7()")
+    )
     user_id: Mapped[UUID] = mapped_column(
         sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
@@ -77,3 +89,16 @@ class Avatar(Base):
     )
 
 
+class AvatarImage(Base):
+    __tablename__ = "avatar_images"
+
+    avatar_id: Mapped[UUID] = mapped_column(
+        sa.Uuid(), sa.ForeignKey("avatars.id", ondelete="CASCADE"), primary_key=True
+    )
+    content_type: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    data: Mapped[bytes] = mapped_column(sa.LargeBinary(), nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False
+    )
+
+
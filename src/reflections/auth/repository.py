@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
+from typing import NamedTuple
 from uuid import UUID
 
 import sqlalchemy as sa  # type: ignore[import-not-found]
@@ -10,15 +11,43 @@ from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found
 from reflections.auth.models import Session, User
 
 
+class UserAuthRow(NamedTuple):
+    """Plain row for the login path: credentials + the public user fields."""
+
+    id: UUID
+    email: str
+    name: str
+    is_admin: bool
+    active_avatar_id: UUID | None
+    created_at: dt.datetime
+    last_login_at: dt.datetime | None
+    password_hash: str
+    disabled_at: dt.datetime | None
+
+
 @dataclass(frozen=True)
 class AuthRepository:
     async def get_user_by_email(
         self, session: AsyncSession, *, email: str
     ) -> User | None:
-        stmt = sa.select(User).where(sa.func.lower(User.email) == email.lower())
+        # Emails are stored lower-cased (insert_user + users_email_lowercase
+        # CHECK), so this is a straight probe of users_email_unique.
+        stmt = sa.select(User).where(User.email == email.lower())
         res = await session.execute(stmt)
         return res.scalar_one_or_none()
 
+    async def get_user_auth_row(
+        self, session: AsyncSession, *, email: str
+    ) -> UserAuthRow | None:
+        # Core column select: no ORM instance, identity-map entry or attribute
+        # instrumentation for a row that's only checked and serialized.
+        stmt = sa.select(*(getattr(User, f) for f in UserAuthRow._fields)).where(
+            User.email == email.lower()
+        )
+        res = await session.execute(stmt)
+        row = res.one_or_none()
+        return UserAuthRow._make(row) if row is not None else None
+
     async def get_user_by_id(self, session: AsyncSession, *, user_id: UUID) -> User | None:
         stmt = sa.select(User).where(User.id == user_id)
         res = await session.execute(stmt)
@@ -39,16 +68,21 @@ class AuthRepository:
         password_hash: str,
         is_admin: bool = False,
     ) -> User:
-        user = User(
-            id=user_id,
-            email=email.lower(),
-            name=name.strip(),
-            password_hash=password_hash,
-            is_admin=is_admin,
+        # INSERT ... RETURNING: server defaults (created_at) come back in the
+        # same statement, so callers needn't refresh.
+        stmt = (
+            sa.insert(User)
+            .values(
+                id=user_id,
+                email=email.lower(),
+                name=name.strip(),
+                password_hash=password_hash,
+                is_admin=is_admin,
+            )
+            .returning(User)
         )
-        session.add(user)
-        await session.flush()
-        return user
+        res = await session.execute(stmt)
+        return res.scalar_one()
 
     async def touch_last_login(
         self, session: AsyncSession, *, user_id: UUID, at: dt.datetime
@@ -59,36 +93,39 @@ class AuthRepository:
             .values(last_login_at=at)
         )
         await session.execute(stmt)
-        await session.flush()
 
     async def insert_session(
         self,
         session: AsyncSession,
         *,
-        session_id: UUID,
         user_id: UUID,
-        token_hash: str,
+        token_hash: bytes,
         expires_at: dt.datetime,
         user_agent: str | None,
         ip: str | None,
     ) -> Session:
-        s = Session(
-            id=session_id,
-            user_id=user_id,
-            token_hash=token_hash,
-            expires_at=expires_at,
-            user_agent=user_agent,
-            ip=ip,
+        # id (uuidv7()) and created_at come back via RETURNING.
+        stmt = (
+            sa.insert(Session)
+            .values(
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+                user_agent=user_agent,
+                ip=ip,
+            )
+            .returning(Session)
         )
-        session.add(s)
-        await session.flush()
-        return s
+        res = await session.execute(stmt)
+        return res.scalar_one()
 
-    async def get_active_session_by_token_hash(
-        self, session: AsyncSession, *, token_hash: str, now: dt.datetime
-    ) -> Session | None:
+    async def get_user_by_active_session_token_hash(
+        self, session: AsyncSession, *, token_hash: bytes, now: dt.datetime
+    ) -> User | None:
+        # One round-trip for the per-request auth check (session -> user).
         stmt = (
-            sa.select(Session)
+            sa.select(User)
+            .join(Session, Session.user_id == User.id)
             .where(Session.token_hash == token_hash)
             .where(Session.revoked_at.is_(None))
             .where(Session.expires_at > now)
@@ -97,7 +134,7 @@ class AuthRepository:
         return res.scalar_one_or_none()
 
     async def revoke_session(
-        self, session: AsyncSession, *, token_hash: str
+        self, session: AsyncSession, *, token_hash: bytes
     ) -> int:
         stmt = (
             sa.update(Session)
@@ -106,7 +143,6 @@ class AuthRepository:
             .values(revoked_at=sa.func.now())
         )
         res = await session.execute(stmt)
-        await session.flush()
         return int(res.rowcount or 0)
 
 
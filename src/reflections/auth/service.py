@@ -19,7 +19,7 @@ from reflections.auth.exceptions import (
     AuthServiceNotFoundException,
     AuthServiceUnprocessableException,
 )
-from reflections.auth.repository import AuthRepository
+from reflections.auth.repository import AuthRepository, UserAuthRow
 from reflections.commons.ids import uuid7_uuid
 from reflections.core.settings import settings
 
@@ -39,7 +39,7 @@ class AuthService:
     async def signup(
         self, session: AsyncSession, *, email: str, name: str, password: str
     ) -> tuple[User, str]:
-        existing = await self.repo.get_user_by_email(session, email=email)
+        existing = await self.repo.get_user_auth_row(session, email=email)
         if existing is not None:
             raise AuthServiceUnprocessableException(
                 "email_taken", "A user with this email already exists"
@@ -67,15 +67,13 @@ class AuthService:
             user_agent=None,
             ip=None,
         )
-        # Ensure server-default columns are loaded (created_at).
-        await session.refresh(user)
         await session.commit()
         return user, token
 
     async def login(
         self, session: AsyncSession, *, email: str, password: str
-    ) -> tuple[User, str]:
-        user = await self.repo.get_user_by_email(session, email=email)
+    ) -> tuple[UserAuthRow, str]:
+        user = await self.repo.get_user_auth_row(session, email=email)
         if user is None:
             raise AuthServiceNotFoundException("invalid_credentials", "User not found")
 
@@ -97,11 +95,8 @@ class AuthService:
         )
         now = _utcnow()
         await self.repo.touch_last_login(session, user_id=user.id, at=now)
-        # Keep the in-memory instance consistent; avoid triggering lazy loads
-        # during response serialization (can cause MissingGreenlet in async ORM).
-        user.last_login_at = now
         await session.commit()
-        return user, token
+        return user._replace(last_login_at=now), token
 
     async def logout(self, session: AsyncSession, *, token: str) -> None:
         token_hash = hash_session_token(token)
@@ -111,14 +106,9 @@ class AuthService:
     async def get_user_for_session_token(
         self, session: AsyncSession, *, token: str
     ) -> Optional[User]:
-        token_hash = hash_session_token(token)
-        now = _utcnow()
-        s = await self.repo.get_active_session_by_token_hash(
-            session, token_hash=token_hash, now=now
+        return await self.repo.get_user_by_active_session_token_hash(
+            session, token_hash=hash_session_token(token), now=_utcnow()
         )
-        if s is None:
-            return None
-        return await self.repo.get_user_by_id(session, user_id=s.user_id)
 
     async def _create_session(
         self,
@@ -133,7 +123,6 @@ class AuthService:
         expires_at = _utcnow() + dt.timedelta(days=ttl_days)
         await self.repo.insert_session(
             session,
-            session_id=uuid7_uuid(),
             user_id=user_id,
             token_hash=hash_session_token(token),
             expires_at=expires_at,
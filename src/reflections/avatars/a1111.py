@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import httpx  # type: ignore[import-not-found]
@@ -13,32 +14,56 @@ class A1111Exception(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass
 class A1111Client:
     base_url: str
+    # One pooled client per process: keep-alive connections are reused across
+    # generations instead of reconnecting per call. Built lazily so it binds to
+    # the running event loop; closed from the app lifespan.
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
 
-    async def txt2img(self, payload: dict[str, Any]) -> str:
-        timeout_s = float(settings.A1111_TIMEOUT_S)
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=timeout_s) as client:
-            resp = await client.post("/sdapi/v1/txt2img", json=payload)
-            resp.raise_for_status()
-            data = resp.json()
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=float(settings.A1111_TIMEOUT_S),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def txt2img(self, payload: dict[str, Any]) -> tuple[bytes, str]:
+        """Generate one image; returns (encoded image bytes, content type)."""
+        resp = await self._client().post("/sdapi/v1/txt2img", json=payload)
+        resp.raise_for_status()
+        # Proxies/misconfigured hosts answer with HTML error pages; reject
+        # those by content type rather than probing the payload.
+        if not resp.headers.get("content-type", "").startswith("application/json"):
+            raise A1111Exception("a1111_unexpected_content_type")
+        data = resp.json()
         images = data.get("images") if isinstance(data, dict) else None
         if not images or not isinstance(images, list) or not images[0]:
             raise A1111Exception("a1111_no_images")
-        # A1111 returns base64-encoded PNG bytes (no data URL prefix).
-        b64 = str(images[0])
-        # Validate b64 is decodable (helps catch HTML error pages).
+        # A1111 only speaks base64-in-JSON (PNG, no data URL prefix); decode
+        # once here so the image is stored and served as raw bytes.
         try:
-            base64.b64decode(b64[:64] + "==", validate=False)
-        except Exception as exc:
-            raise A1111Exception(f"a1111_invalid_image_b64:{exc!s}") from exc
-        return f"data:image/png;base64,{b64}"
+            return base64.b64decode(images[0], validate=True), "image/png"
+        except ValueError as exc:
+            raise A1111Exception("a1111_invalid_image_b64") from exc
 
 
+@lru_cache
 def get_a1111_client() -> A1111Client:
     if not settings.A1111_BASE_URL:
         raise A1111Exception("A1111_BASE_URL is not configured")
     return A1111Client(base_url=str(settings.A1111_BASE_URL))
 
 
+async def close_a1111_client() -> None:
+    # Only close a client that was actually built; never construct one here.
+    if get_a1111_client.cache_info().currsize:
+        await get_a1111_client().aclose()
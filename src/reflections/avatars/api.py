@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException  # type: ignore[import-not-found]
+from fastapi import APIRouter, Depends, HTTPException, Response  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 from starlette import status  # type: ignore[import-not-found]
 
@@ -25,13 +24,18 @@ from reflections.commons.depends import database_session
 router = APIRouter(prefix="/avatars", tags=["avatars"])
 
 
-@lru_cache
+# Built once at import; a zero-arg lru_cache would only add a lookup per
+# request on every avatar endpoint.
+_AVATARS_SVC = AvatarsService.create()
+
+
 def get_avatars_service() -> AvatarsService:
-    return AvatarsService.create()
+    return _AVATARS_SVC
 
 
 def _to_public(a) -> AvatarPublic:  # type: ignore[no-untyped-def]
-    return AvatarPublic(
+    # ORM columns are already typed; skip per-field validation.
+    return AvatarPublic.model_construct(
         id=a.id,
         user_id=a.user_id,
         name=a.name,
@@ -48,9 +52,14 @@ async def list_avatars(
     session: Annotated[AsyncSession, Depends(database_session)],
     svc: Annotated[AvatarsService, Depends(get_avatars_service)],
     user=Depends(current_user_required),
-) -> ListAvatarsResponse:
+) -> Response:
     items, active = await svc.list_avatars(session, user=user)
-    return ListAvatarsResponse(items=[_to_public(a) for a in items], active_avatar_id=active)
+    # Serialize once in pydantic-core (same as the conversations router)
+    # rather than returning the model for FastAPI to re-validate and re-encode.
+    body = ListAvatarsResponse.model_construct(
+        items=[_to_public(a) for a in items], active_avatar_id=active
+    )
+    return Response(content=body.model_dump_json(), media_type="application/json")
 
 
 @router.post("", response_model=AvatarPublic, status_code=status.HTTP_201_CREATED)
@@ -134,6 +143,29 @@ async def generate_avatar_image(
     return GenerateAvatarImageResponse(image_url=image_url)
 
 
+@router.get("/{avatar_id}/image")
+async def get_avatar_image(
+    avatar_id: str,
+    session: Annotated[AsyncSession, Depends(database_session)],
+    svc: Annotated[AvatarsService, Depends(get_avatars_service)],
+    user=Depends(current_user_required),
+) -> Response:
+    from uuid import UUID
+
+    img = await svc.get_image(session, user=user, avatar_id=UUID(avatar_id))
+    if img is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
+        )
+    # image_url carries a per-generation version param, so the bytes behind
+    # any given URL never change.
+    return Response(
+        content=img.data,
+        media_type=img.content_type,
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
+
+
 @router.post("/active", response_model=OkResponse)
 async def set_active_avatar(
     req: SetActiveAvatarRequest,
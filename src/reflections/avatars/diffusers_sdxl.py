@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import io
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from functools import lru_cache
 
 from reflections.core.settings import settings
@@ -62,7 +62,56 @@ def _dtype_from_str(s: str):  # type: ignore[no-untyped-def]
     raise DiffusersSDXLException(f"diffusers_invalid_dtype:{s}")
 
 
-@dataclass(frozen=True)
+def _quantize_unet(unet, mode: str):  # type: ignore[no-untyped-def]
+    """
+    Weight-only quantize the unet in place (torchao).
+
+    The unet dominates generation time and is memory-bandwidth bound, so
+    int8/fp8 weights cut the bytes moved per step. Activations stay in the
+    pipeline dtype.
+    """
+    v = (mode or "").lower().strip()
+    if v in {"", "none"}:
+        return
+    try:
+        from torchao.quantization import (  # type: ignore[import-not-found]
+            float8_weight_only,
+            int8_weight_only,
+            quantize_,
+        )
+    except ImportError as exc:
+        raise DiffusersSDXLException("diffusers_quantize_requires_torchao") from exc
+    if v == "int8":
+        quantize_(unet, int8_weight_only())
+    elif v == "fp8":
+        quantize_(unet, float8_weight_only())
+    else:
+        raise DiffusersSDXLException(f"diffusers_invalid_quantize:{mode}")
+
+
+def _configure_attention(pipe, device: str) -> None:  # type: ignore[no-untyped-def]
+    """
+    Keep the fused attention kernel wherever memory allows.
+
+    On torch >= 2 Diffusers already defaults to SDPA (AttnProcessor2_0:
+    flash / memory-efficient attention), which attention slicing would
+    replace with a slower sliced processor. Only MPS, where unified memory
+    is shared with the OS and SDXL attention maps are large, keeps slicing.
+    """
+    if device == "mps":
+        if hasattr(pipe, "enable_attention_slicing"):
+            pipe.enable_attention_slicing()
+        return
+    unet = getattr(pipe, "unet", None)
+    if unet is not None and hasattr(unet, "set_attn_processor"):
+        from diffusers.models.attention_processor import (  # type: ignore[import-not-found]
+            AttnProcessor2_0,
+        )
+
+        unet.set_attn_processor(AttnProcessor2_0())
+
+
+@dataclass
 class DiffusersSDXLClient:
     base_model: str
     refiner_model: str | None
@@ -71,6 +120,19 @@ class DiffusersSDXLClient:
     dtype: str
     high_noise_frac: float
     enable_compile: bool
+    quantize: str = "none"
+    image_format: str = "png"
+    # Pipelines are loaded once per process (multi-GB weights, compile warm-up)
+    # and reused by every request. The load lock keeps concurrent first
+    # requests from loading twice; the run lock serializes generations, since
+    # a pipeline's scheduler state is mutated per call and isn't thread-safe.
+    _pipes: tuple | None = field(default=None, init=False, repr=False)
+    _load_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _run_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
     def _load_pipes(self):  # type: ignore[no-untyped-def]
         """
@@ -123,11 +185,11 @@ class DiffusersSDXLClient:
             variant=variant,
             local_files_only=bool(self.local_files_only),
         )
-        if hasattr(base, "enable_attention_slicing"):
-            base.enable_attention_slicing()
+        _configure_attention(base, device)
         if hasattr(base, "enable_vae_slicing"):
             base.enable_vae_slicing()
         base.to(device)
+        _quantize_unet(base.unet, self.quantize)
         if self.enable_compile and hasattr(torch, "compile"):
             try:
                 base.unet = torch.compile(  # type: ignore[attr-defined]
@@ -148,11 +210,11 @@ class DiffusersSDXLClient:
                 variant=variant,
                 local_files_only=bool(self.local_files_only),
             )
-            if hasattr(refiner, "enable_attention_slicing"):
-                refiner.enable_attention_slicing()
+            _configure_attention(refiner, device)
             if hasattr(refiner, "enable_vae_slicing"):
                 refiner.enable_vae_slicing()
             refiner.to(device)
+            _quantize_unet(refiner.unet, self.quantize)
             if self.enable_compile and hasattr(torch, "compile"):
                 try:
                     refiner.unet = torch.compile(  # type: ignore[attr-defined]
@@ -163,11 +225,16 @@ class DiffusersSDXLClient:
 
         return base, refiner
 
-    @lru_cache(maxsize=1)
     def _pipes_cached(self):  # type: ignore[no-untyped-def]
-        return self._load_pipes()
-
-    def _generate_sync(self, *, prompt: str, negative_prompt: str | None, width: int, height: int, steps: int, cfg_scale: float, seed: int) -> str:  # type: ignore[no-untyped-def]
+        pipes = self._pipes
+        if pipes is None:
+            with self._load_lock:
+                pipes = self._pipes
+                if pipes is None:
+                    pipes = self._pipes = self._load_pipes()
+        return pipes
+
+    def _generate_sync(self, *, prompt: str, negative_prompt: str | None, width: int, height: int, steps: int, cfg_scale: float, seed: int) -> tuple[bytes | memoryview, str]:  # type: ignore[no-untyped-def]
         import torch  # type: ignore[import-not-found]
 
         base, refiner = self._pipes_cached()
@@ -177,42 +244,74 @@ class DiffusersSDXLClient:
             # Using CPU generator tends to be the most portable across devices.
             generator = torch.Generator(device="cpu").manual_seed(int(seed))
 
-        if refiner is None:
-            img = base(
-                prompt=prompt,
-                negative_prompt=negative_prompt,
-                width=int(width),
-                height=int(height),
-                num_inference_steps=int(steps),
-                guidance_scale=float(cfg_scale),
-                generator=generator,
-            ).images[0]
-        else:
-            latents = base(
-                prompt=prompt,
-                negative_prompt=negative_prompt,
-                width=int(width),
-                height=int(height),
-                num_inference_steps=int(steps),
-                denoising_end=float(self.high_noise_frac),
-                guidance_scale=float(cfg_scale),
-                generator=generator,
-                output_type="latent",
-            ).images
-            img = refiner(
-                prompt=prompt,
-                negative_prompt=negative_prompt,
-                num_inference_steps=int(steps),
-                denoising_start=float(self.high_noise_frac),
-                guidance_scale=float(cfg_scale),
-                generator=generator,
-                image=latents,
-            ).images[0]
+        # inference_mode: no autograd/version-counter bookkeeping per op. (CUDA
+        # graph replay of the unet comes from DIFFUSERS_ENABLE_COMPILE, whose
+        # mode="reduce-overhead" captures graphs per input shape.)
+        with self._run_lock, torch.inference_mode():
+            if refiner is None:
+                img = base(
+                    prompt=prompt,
+                    negative_prompt=negative_prompt,
+                    width=int(width),
+                    height=int(height),
+                    num_inference_steps=int(steps),
+                    guidance_scale=float(cfg_scale),
+                    generator=generator,
+                ).images[0]
+            else:
+                # Encode the prompt once and hand the embeddings to both stages.
+                # The refiner only has text_encoder_2 (shared with base), whose
+                # hidden states are the trailing slice of base's concatenated
+                # embeddings; the pooled embeddings come from that same encoder.
+                do_cfg = float(cfg_scale) > 1.0
+                pe, npe, pooled, npooled = base.encode_prompt(
+                    prompt=prompt,
+                    negative_prompt=negative_prompt,
+                    device=base._execution_device,
+                    num_images_per_prompt=1,
+                    do_classifier_free_guidance=do_cfg,
+                )
+                latents = base(
+                    prompt_embeds=pe,
+                    negative_prompt_embeds=npe,
+                    pooled_prompt_embeds=pooled,
+                    negative_pooled_prompt_embeds=npooled,
+                    width=int(width),
+                    height=int(height),
+                    num_inference_steps=int(steps),
+                    denoising_end=float(self.high_noise_frac),
+                    guidance_scale=float(cfg_scale),
+                    generator=generator,
+                    output_type="latent",
+                ).images
+                dim = int(base.text_encoder_2.config.hidden_size)
+                refiner_kwargs: dict = {
+                    "prompt_embeds": pe[..., -dim:],
+                    "pooled_prompt_embeds": pooled,
+                }
+                # With no negative prompt, base may zero its negatives
+                # (force_zeros_for_empty_prompt) while the refiner encodes "";
+                # let the refiner keep its own behaviour there.
+                if do_cfg and negative_prompt is not None:
+                    refiner_kwargs["negative_prompt_embeds"] = npe[..., -dim:]
+                    refiner_kwargs["negative_pooled_prompt_embeds"] = npooled
+                img = refiner(
+                    **refiner_kwargs,
+                    num_inference_steps=int(steps),
+                    denoising_start=float(self.high_noise_frac),
+                    guidance_scale=float(cfg_scale),
+                    generator=generator,
+                    image=latents,
+                ).images[0]
 
         buf = io.BytesIO()
+        # getbuffer() is a view over the encoded bytes (getvalue() would copy
+        # them); psycopg writes it to bytea as-is.
+        if self.image_format.lower().strip() == "webp":
+            img.save(buf, format="WEBP", quality=90)
+            return buf.getbuffer(), "image/webp"
         img.save(buf, format="PNG")
-        b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-        return f"data:image/png;base64,{b64}"
+        return buf.getbuffer(), "image/png"
 
     async def txt2img(
         self,
@@ -224,7 +323,7 @@ class DiffusersSDXLClient:
         steps: int,
         cfg_scale: float,
         seed: int,
-    ) -> str:
+    ) -> tuple[bytes | memoryview, str]:
         # Diffusers generation is blocking + GPU-heavy; keep it off the event loop.
         return await asyncio.to_thread(
             self._generate_sync,
@@ -238,6 +337,7 @@ class DiffusersSDXLClient:
         )
 
 
+@lru_cache
 def get_diffusers_sdxl_client() -> DiffusersSDXLClient:
     if not settings.DIFFUSERS_SDXL_BASE_MODEL:
         raise DiffusersSDXLException("DIFFUSERS_SDXL_BASE_MODEL is not configured")
@@ -251,6 +351,8 @@ def get_diffusers_sdxl_client() -> DiffusersSDXLClient:
         dtype=str(settings.DIFFUSERS_DTYPE),
         high_noise_frac=float(settings.DIFFUSERS_HIGH_NOISE_FRAC),
         enable_compile=bool(settings.DIFFUSERS_ENABLE_COMPILE),
+        quantize=str(settings.DIFFUSERS_QUANTIZE),
+        image_format=str(settings.DIFFUSERS_IMAGE_FORMAT),
     )
 
 
@@ -1,22 +1,36 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
 import sqlalchemy as sa  # type: ignore[import-not-found]
+from sqlalchemy.dialects.postgresql import (  # type: ignore[import-not-found]
+    insert as pg_insert,
+)
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
+from sqlalchemy.orm import raiseload  # type: ignore[import-not-found]
 
-from reflections.auth.models import Avatar, User
-from reflections.commons.ids import uuid7_uuid
+from reflections.auth.models import Avatar, AvatarImage, User
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AvatarsRepository:
-    async def list_for_user(self, session: AsyncSession, *, user_id: UUID) -> list[Avatar]:
-        stmt = sa.select(Avatar).where(Avatar.user_id == user_id).order_by(Avatar.created_at.desc())
+    async def list_for_user(
+        self, session: AsyncSession, *, user_id: UUID
+    ) -> Sequence[Avatar]:
+        # raiseload("*"): Avatar has no relationships today; if one is added,
+        # lazily touching it while serializing the list fails loudly instead
+        # of quietly issuing one query per avatar.
+        stmt = (
+            sa.select(Avatar)
+            .where(Avatar.user_id == user_id)
+            .options(raiseload("*"))
+            .order_by(Avatar.created_at.desc())
+        )
         res = await session.execute(stmt)
-        return list(res.scalars().all())
+        return res.scalars().all()
 
     async def get_for_user(
         self, session: AsyncSession, *, user_id: UUID, avatar_id: UUID
@@ -40,8 +54,8 @@ class AvatarsRepository:
         voice_config: dict | None,
     ) -> Avatar:
         now = dt.datetime.now(dt.UTC)
+        # id comes from the uuidv7() server default via RETURNING.
         a = Avatar(
-            id=uuid7_uuid(),
             user_id=user_id,
             name=name.strip(),
             persona_prompt=persona_prompt,
@@ -51,6 +65,7 @@ class AvatarsRepository:
             updated_at=now,
         )
         session.add(a)
+        # Flushed now: callers need the server-generated id before commit.
         await session.flush()
         return a
 
@@ -65,8 +80,7 @@ class AvatarsRepository:
         image_url: str | None,
         voice_config: dict | None,
     ) -> Avatar | None:
-        now = dt.datetime.now(dt.UTC)
-        values: dict = {"updated_at": now}
+        values: dict = {}
         if name is not None:
             values["name"] = name.strip()
         if persona_prompt is not None:
@@ -75,16 +89,20 @@ class AvatarsRepository:
             values["image_url"] = image_url
         if voice_config is not None:
             values["voice_config"] = voice_config
+        if not values:
+            # No-op PATCH: skip the UPDATE (and its WAL) and leave updated_at.
+            return await self.get_for_user(
+                session, user_id=user_id, avatar_id=avatar_id
+            )
 
         stmt = (
             sa.update(Avatar)
             .where(Avatar.id == avatar_id)
             .where(Avatar.user_id == user_id)
-            .values(**values)
+            .values(**values, updated_at=dt.datetime.now(dt.UTC))
             .returning(Avatar)
         )
         res = await session.execute(stmt)
-        await session.flush()
         return res.scalar_one_or_none()
 
     async def set_image_url(
@@ -99,7 +117,40 @@ class AvatarsRepository:
             .returning(Avatar)
         )
         res = await session.execute(stmt)
-        await session.flush()
+        return res.scalar_one_or_none()
+
+    async def put_image(
+        self,
+        session: AsyncSession,
+        *,
+        avatar_id: UUID,
+        data: bytes | memoryview,
+        content_type: str,
+    ) -> None:
+        # Caller checks ownership (set_image_url) in the same transaction.
+        stmt = pg_insert(AvatarImage).values(
+            avatar_id=avatar_id, content_type=content_type, data=data
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AvatarImage.avatar_id],
+            set_={
+                "content_type": stmt.excluded.content_type,
+                "data": stmt.excluded.data,
+                "updated_at": sa.func.now(),
+            },
+        )
+        await session.execute(stmt)
+
+    async def get_image(
+        self, session: AsyncSession, *, user_id: UUID, avatar_id: UUID
+    ) -> AvatarImage | None:
+        stmt = (
+            sa.select(AvatarImage)
+            .join(Avatar, Avatar.id == AvatarImage.avatar_id)
+            .where(AvatarImage.avatar_id == avatar_id)
+            .where(Avatar.user_id == user_id)
+        )
+        res = await session.execute(stmt)
         return res.scalar_one_or_none()
 
     async def delete_for_user(
@@ -107,18 +158,22 @@ class AvatarsRepository:
     ) -> int:
         stmt = sa.delete(Avatar).where(Avatar.id == avatar_id).where(Avatar.user_id == user_id)
         res = await session.execute(stmt)
-        await session.flush()
         return int(res.rowcount or 0)
 
     async def set_active_avatar(
         self, session: AsyncSession, *, user_id: UUID, avatar_id: UUID | None
-    ) -> None:
+    ) -> bool:
+        # Only points at an avatar the user owns; False if nothing matched.
         stmt = (
             sa.update(User)
             .where(User.id == user_id)
             .values(active_avatar_id=avatar_id)
         )
-        await session.execute(stmt)
-        await session.flush()
-
-
+        if avatar_id is not None:
+            stmt = stmt.where(
+                sa.exists()
+                .where(Avatar.id == avatar_id)
+                .where(Avatar.user_id == user_id)
+            )
+        res = await session.execute(stmt)
+        return bool(res.rowcount)
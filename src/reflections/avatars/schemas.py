@@ -4,10 +4,13 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field  # type: ignore[import-not-found]
+from pydantic import BaseModel, ConfigDict, Field  # type: ignore[import-not-found]
 
 
 class AvatarPublic(BaseModel):
+    # Read-only view of a DB row, built internally via model_construct.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: UUID
     user_id: UUID
     name: str
@@ -1,18 +1,63 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from uuid import UUID
 
+from sqlalchemy import inspect as sa_inspect  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
+from sqlalchemy.orm.attributes import set_committed_value  # type: ignore[import-not-found]
 
 from reflections.avatars.a1111 import get_a1111_client
-from reflections.avatars.diffusers_sdxl import DiffusersSDXLException, get_diffusers_sdxl_client
 from reflections.avatars.repository import AvatarsRepository
-from reflections.auth.models import Avatar, User
+from reflections.auth.models import Avatar, AvatarImage, User
 from reflections.core.settings import settings
 
 
-@dataclass
+def _image_path(avatar_id: UUID) -> str:
+    # Served by GET /avatars/{id}/image. The version param changes on every
+    # generation so clients can cache each image indefinitely.
+    return f"/avatars/{avatar_id}/image?v={time.time_ns() // 1_000_000}"
+
+
+_SDXL_ENGINE = "diffusers_sdxl"
+_A1111_ENGINE = "a1111"
+
+# Engine aliases (already normalized) -> canonical engine. Built once at
+# import; routing is a single dict probe, with no per-call set literals.
+_ENGINE_DISPATCH: dict[str, str] = {
+    "diffusers_sdxl": _SDXL_ENGINE,
+    "diffusers": _SDXL_ENGINE,
+    "sdxl": _SDXL_ENGINE,
+    "a1111": _A1111_ENGINE,
+    "automatic1111": _A1111_ENGINE,
+}
+
+
+@lru_cache(maxsize=32)
+def _resolve_engine(engine: str) -> str | None:
+    # Requests repeat a handful of spellings; normalize each one once.
+    return _ENGINE_DISPATCH.get(engine.lower().strip())
+
+
+@lru_cache(maxsize=1)
+def _default_engine() -> str | None:
+    # Settings are fixed for the process lifetime.
+    return _resolve_engine(settings.AVATAR_IMAGE_ENGINE or "a1111")
+
+
+def _sync_active_avatar(user: User, avatar_id: UUID | None) -> None:
+    # Mirror a value SQL already wrote without marking the row dirty;
+    # a plain assignment would make the commit flush a second UPDATE users.
+    set_committed_value(user, "active_avatar_id", avatar_id)
+
+
+# Each mutation is one transaction with a single commit. (Not wrapped in
+# `session.begin()`: the auth lookup on the same request session has already
+# autobegun the transaction.)
+@dataclass(slots=True)
 class AvatarsService:
     repo: AvatarsRepository
 
@@ -20,7 +65,9 @@ class AvatarsService:
     def create(cls) -> "AvatarsService":
         return cls(repo=AvatarsRepository())
 
-    async def list_avatars(self, session: AsyncSession, *, user: User) -> tuple[list[Avatar], UUID | None]:
+    async def list_avatars(
+        self, session: AsyncSession, *, user: User
+    ) -> tuple[Sequence[Avatar], UUID | None]:
         items = await self.repo.list_for_user(session, user_id=user.id)
         return items, user.active_avatar_id
 
@@ -44,8 +91,15 @@ class AvatarsService:
             voice_config=voice_config,
         )
         if set_active:
-            await self.repo.set_active_avatar(session, user_id=user.id, avatar_id=a.id)
-            user.active_avatar_id = a.id
+            if sa_inspect(user).session is session.sync_session:
+                # The commit's flush writes it alongside the avatar INSERT;
+                # ownership is implied since the avatar was just created.
+                user.active_avatar_id = a.id
+            else:
+                await self.repo.set_active_avatar(
+                    session, user_id=user.id, avatar_id=a.id
+                )
+                _sync_active_avatar(user, a.id)
         await session.commit()
         return a
 
@@ -78,23 +132,24 @@ class AvatarsService:
         deleted = await self.repo.delete_for_user(
             session, user_id=user.id, avatar_id=avatar_id
         )
-        # If we deleted the active avatar, clear it.
-        if user.active_avatar_id == avatar_id:
-            await self.repo.set_active_avatar(session, user_id=user.id, avatar_id=None)
-            user.active_avatar_id = None
+        # Deleting the active avatar clears users.active_avatar_id in the same
+        # statement (FK ON DELETE SET NULL); just mirror it in memory.
+        if deleted and user.active_avatar_id == avatar_id:
+            _sync_active_avatar(user, None)
         await session.commit()
         return deleted
 
     async def set_active(
         self, session: AsyncSession, *, user: User, avatar_id: UUID | None
     ) -> None:
-        if avatar_id is not None:
-            a = await self.repo.get_for_user(session, user_id=user.id, avatar_id=avatar_id)
-            if a is None:
-                # Ignore invalid ids (client may be stale); keep existing active avatar.
-                return
-        await self.repo.set_active_avatar(session, user_id=user.id, avatar_id=avatar_id)
-        user.active_avatar_id = avatar_id
+        # Ownership check and update in one statement. Invalid ids are ignored
+        # (client may be stale); the existing active avatar is kept.
+        updated = await self.repo.set_active_avatar(
+            session, user_id=user.id, avatar_id=avatar_id
+        )
+        if not updated:
+            return
+        _sync_active_avatar(user, avatar_id)
         await session.commit()
 
     async def generate_image_a1111(
@@ -112,31 +167,28 @@ class AvatarsService:
         sampler_name: str | None,
         seed: int,
     ) -> str:
-        a = await self.repo.get_for_user(session, user_id=user.id, avatar_id=avatar_id)
-        if a is None:
-            raise ValueError("avatar_not_found")
-
+        # Values arrive validated (GenerateAvatarImageRequest); no re-coercion.
         payload: dict = {
             "prompt": prompt,
-            "width": int(width),
-            "height": int(height),
-            "steps": int(steps),
-            "cfg_scale": float(cfg_scale),
-            "seed": int(seed),
+            "width": width,
+            "height": height,
+            "steps": steps,
+            "cfg_scale": cfg_scale,
+            "seed": seed,
         }
         if negative_prompt:
             payload["negative_prompt"] = negative_prompt
         if sampler_name:
             payload["sampler_name"] = sampler_name
 
-        image_url = await get_a1111_client().txt2img(payload)
-        updated = await self.repo.set_image_url(
-            session, user_id=user.id, avatar_id=avatar_id, image_url=image_url
+        data, content_type = await get_a1111_client().txt2img(payload)
+        return await self._store_image(
+            session,
+            user=user,
+            avatar_id=avatar_id,
+            data=data,
+            content_type=content_type,
         )
-        if updated is None:
-            raise ValueError("avatar_not_found")
-        await session.commit()
-        return image_url
 
     async def generate_image_diffusers_sdxl(
         self,
@@ -152,27 +204,56 @@ class AvatarsService:
         cfg_scale: float,
         seed: int,
     ) -> str:
-        a = await self.repo.get_for_user(session, user_id=user.id, avatar_id=avatar_id)
-        if a is None:
-            raise ValueError("avatar_not_found")
+        # Imported on first use: a1111-only deployments never load the
+        # diffusers module (torch/diffusers themselves are imported lazily
+        # inside it when the pipeline is built).
+        from reflections.avatars.diffusers_sdxl import get_diffusers_sdxl_client
 
-        try:
-            image_url = await get_diffusers_sdxl_client().txt2img(
-                prompt=prompt,
-                negative_prompt=negative_prompt,
-                width=width,
-                height=height,
-                steps=steps,
-                cfg_scale=cfg_scale,
-                seed=seed,
-            )
-        except DiffusersSDXLException:
-            raise
+        data, content_type = await get_diffusers_sdxl_client().txt2img(
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            width=width,
+            height=height,
+            steps=steps,
+            cfg_scale=cfg_scale,
+            seed=seed,
+        )
+        return await self._store_image(
+            session,
+            user=user,
+            avatar_id=avatar_id,
+            data=data,
+            content_type=content_type,
+        )
+
+    async def get_image(
+        self, session: AsyncSession, *, user: User, avatar_id: UUID
+    ) -> AvatarImage | None:
+        return await self.repo.get_image(session, user_id=user.id, avatar_id=avatar_id)
+
+    async def _store_image(
+        self,
+        session: AsyncSession,
+        *,
+        user: User,
+        avatar_id: UUID,
+        data: bytes | memoryview,
+        content_type: str,
+    ) -> str:
+        # Raw bytes go to avatar_images; the avatar row only carries a short
+        # URL, so avatar lists no longer ship multi-MB base64 strings. No
+        # upfront existence SELECT: the owner-scoped UPDATE ... RETURNING
+        # below is the check (an unknown id costs a wasted generation, not a
+        # query on every request).
+        image_url = _image_path(avatar_id)
         updated = await self.repo.set_image_url(
             session, user_id=user.id, avatar_id=avatar_id, image_url=image_url
         )
         if updated is None:
             raise ValueError("avatar_not_found")
+        await self.repo.put_image(
+            session, avatar_id=avatar_id, data=data, content_type=content_type
+        )
         await session.commit()
         return image_url
 
@@ -192,8 +273,8 @@ class AvatarsService:
         seed: int,
         engine: str | None = None,
     ) -> str:
-        chosen = (engine or settings.AVATAR_IMAGE_ENGINE or "a1111").lower().strip()
-        if chosen in {"diffusers_sdxl", "diffusers", "sdxl"}:
+        chosen = _resolve_engine(engine) if engine else _default_engine()
+        if chosen == _SDXL_ENGINE:
             return await self.generate_image_diffusers_sdxl(
                 session,
                 user=user,
@@ -206,7 +287,7 @@ class AvatarsService:
                 cfg_scale=cfg_scale,
                 seed=seed,
             )
-        if chosen in {"a1111", "automatic1111"}:
+        if chosen == _A1111_ENGINE:
             return await self.generate_image_a1111(
                 session,
                 user=user,
@@ -8,7 +8,6 @@ from reflections.core.db import database_manager
 
 
 async def database_session() -> AsyncGenerator[AsyncSession, None]:
-    # Ensure DB is initialized before yielding sessions.
-    await database_manager.initialize()
+    # The engine is created once in the app lifespan (api.main), not per request.
     async with database_manager.session() as session:
         yield session
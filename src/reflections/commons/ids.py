@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from uuid6 import uuid7  # type: ignore[import-not-found]
+try:
+    # compat returns stdlib UUIDs, which psycopg/SQLAlchemy bind natively.
+    from uuid_utils.compat import uuid7  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - platforms without a wheel
+    from uuid6 import uuid7  # type: ignore[import-not-found]
 
 
 def uuid7_uuid() -> UUID:
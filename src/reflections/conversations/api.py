@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from collections.abc import AsyncIterator
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query  # type: ignore[import-not-found]
+import orjson  # type: ignore[import-not-found]
+from fastapi import APIRouter, Depends, HTTPException, Query, Response  # type: ignore[import-not-found]
+from fastapi.responses import StreamingResponse  # type: ignore[import-not-found]
+from pydantic import BaseModel  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 from starlette import status  # type: ignore[import-not-found]
 
@@ -14,6 +17,7 @@ from reflections.conversations.exceptions import (
     CONVERSATION_NOT_FOUND,
     ConversationsServiceException,
 )
+from reflections.conversations.repository import TurnRow
 from reflections.conversations.schemas import (
     ConversationPublic,
     ConversationTurnPublic,
@@ -22,19 +26,21 @@ from reflections.conversations.schemas import (
     RecentConversationResponse,
     RecentTurn,
 )
-from reflections.conversations.service import ConversationsService
+from reflections.conversations.service import (
+    ConversationsService,
+    get_conversations_service,
+)
 
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
 
-@lru_cache
-def get_conversations_service() -> ConversationsService:
-    return ConversationsService.create()
-
-
+# Rows come straight from typed ORM columns, so the public models are built
+# with model_construct (no per-field validation) and serialized once by
+# pydantic-core; returning the model itself would make FastAPI dump and
+# re-validate it against response_model.
 def _to_conversation_public(c) -> ConversationPublic:  # type: ignore[no-untyped-def]
-    return ConversationPublic(
+    return ConversationPublic.model_construct(
         id=c.id,
         user_id=c.user_id,
         avatar_id=c.avatar_id,
@@ -44,7 +50,7 @@ def _to_conversation_public(c) -> ConversationPublic:  # type: ignore[no-untyped
 
 
 def _to_turn_public(t) -> ConversationTurnPublic:  # type: ignore[no-untyped-def]
-    return ConversationTurnPublic(
+    return ConversationTurnPublic.model_construct(
         id=t.id,
         conversation_id=t.conversation_id,
         seq=t.seq,
@@ -54,6 +60,19 @@ def _to_turn_public(t) -> ConversationTurnPublic:  # type: ignore[no-untyped-def
     )
 
 
+def _parse_conversation_id(raw: str) -> UUID:
+    try:
+        return UUID(raw)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
+        ) from None
+
+
+def _json(model: BaseModel) -> Response:
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.get("", response_model=ListConversationsResponse)
 async def list_conversations(
     session: Annotated[AsyncSession, Depends(database_session)],
@@ -61,9 +80,13 @@ async def list_conversations(
     user=Depends(current_user_required),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-) -> ListConversationsResponse:
+) -> Response:
     items = await svc.list_conversations(session, user=user, limit=limit, offset=offset)
-    return ListConversationsResponse(items=[_to_conversation_public(c) for c in items])
+    return _json(
+        ListConversationsResponse.model_construct(
+            items=[_to_conversation_public(c) for c in items]
+        )
+    )
 
 
 @router.get("/recent", response_model=RecentConversationResponse)
@@ -98,11 +121,8 @@ async def get_conversation(
     session: Annotated[AsyncSession, Depends(database_session)],
     svc: Annotated[ConversationsService, Depends(get_conversations_service)],
     user=Depends(current_user_required),
-) -> GetConversationResponse:
-    try:
-        cid = UUID(conversation_id)
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+) -> Response:
+    cid = _parse_conversation_id(conversation_id)
 
     try:
         c, turns = await svc.get_conversation(session, user=user, conversation_id=cid)
@@ -111,9 +131,42 @@ async def get_conversation(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
         raise
 
-    return GetConversationResponse(
-        conversation=_to_conversation_public(c),
-        turns=[_to_turn_public(t) for t in turns],
+    return _json(
+        GetConversationResponse.model_construct(
+            conversation=_to_conversation_public(c),
+            turns=[_to_turn_public(t) for t in turns],
+        )
     )
 
 
+async def _ndjson_lines(turns: AsyncIterator[TurnRow]) -> AsyncIterator[bytes]:
+    # TurnRow fields match ConversationTurnPublic; orjson encodes UUID and
+    # datetime natively.
+    async for t in turns:
+        yield orjson.dumps(t._asdict()) + b"\n"
+
+
+@router.get("/{conversation_id}/turns.ndjson")
+async def stream_conversation_turns(
+    conversation_id: str,
+    session: Annotated[AsyncSession, Depends(database_session)],
+    svc: Annotated[ConversationsService, Depends(get_conversations_service)],
+    user=Depends(current_user_required),
+) -> StreamingResponse:
+    """
+    Every turn of a conversation as NDJSON (one ConversationTurnPublic per
+    line), streamed from a DB cursor instead of built in memory. Meant for
+    long histories; GET /conversations/{id} stays the one-shot view.
+    """
+    cid = _parse_conversation_id(conversation_id)
+
+    try:
+        turns = await svc.stream_turns(session, user=user, conversation_id=cid)
+    except ConversationsServiceException as exc:
+        if getattr(exc, "details", None) == CONVERSATION_NOT_FOUND:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
+            ) from exc
+        raise
+
+    return StreamingResponse(_ndjson_lines(turns), media_type="application/x-ndjson")
@@ -8,5 +8,4 @@ class ConversationsServiceException(BaseServiceException):
 
 
 CONVERSATION_NOT_FOUND = "conversation_not_found"
-
-
+TURN_SEQ_CONFLICT = "turn_seq_conflict"
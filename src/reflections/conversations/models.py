@@ -12,7 +12,9 @@ from reflections.auth.models import Base
 class Conversation(Base):
     __tablename__ = "conversations"
 
-    id: Mapped[UUID] = mapped_column(sa.Uuid(), primary_key=True)
+    id: Mapped[UUID] = mapped_column(
+        sa.Uuid(), primary_key=True, server_default=sa.text("uuidv7()")
+    )
     user_id: Mapped[UUID] = mapped_column(
         sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
@@ -29,8 +31,19 @@ class Conversation(Base):
 
 class ConversationTurn(Base):
     __tablename__ = "conversation_turns"
+    # Created in 0007; the append statements' ON CONFLICT targets it.
+    __table_args__ = (
+        sa.Index(
+            "ix_conversation_turns_conversation_id_seq",
+            "conversation_id",
+            "seq",
+            unique=True,
+        ),
+    )
 
-    id: Mapped[UUID] = mapped_column(sa.Uuid(), primary_key=True)
+    id: Mapped[UUID] = mapped_column(
+        sa.Uuid(), primary_key=True, server_default=sa.text("uuidv7()")
+    )
     conversation_id: Mapped[UUID] = mapped_column(
         sa.Uuid(),
         sa.ForeignKey("conversations.id", ondelete="CASCADE"),
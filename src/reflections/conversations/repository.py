@@ -1,82 +1,221 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from typing import NamedTuple
 from uuid import UUID
 
 import sqlalchemy as sa  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 
-from reflections.commons.ids import uuid7_uuid
+from reflections.conversations.exceptions import (
+    TURN_SEQ_CONFLICT,
+    ConversationsServiceException,
+)
 from reflections.conversations.models import Conversation, ConversationTurn
 
+# Read-only list paths select bare columns: Rows expose the same attribute
+# names as the entities, without ORM hydration or identity-map bookkeeping.
+#
+# The hot read queries are built with sa.lambda_stmt: the statement is cached
+# by the lambda's code location and its closure values (ids, limit/offset)
+# are extracted as bound parameters, so repeat calls skip rebuilding and
+# traversing the select() tree to compute a cache key.
+_CONVERSATION_COLS = (
+    Conversation.id,
+    Conversation.user_id,
+    Conversation.avatar_id,
+    Conversation.created_at,
+    Conversation.updated_at,
+)
+_TURN_COLS = (
+    ConversationTurn.id,
+    ConversationTurn.conversation_id,
+    ConversationTurn.seq,
+    ConversationTurn.role,
+    ConversationTurn.content,
+    ConversationTurn.created_at,
+)
 
-@dataclass(frozen=True)
+# next seq + INSERT a (user, assistant) turn pair at consecutive seqs + touch
+# conversations.updated_at in one round-trip. id/created_at come from the
+# column server defaults. max(seq) is an index-only probe on the unique
+# (conversation_id, seq) index; a concurrent append that took the same seq
+# makes ON CONFLICT skip the insert. The VALUES params are cast since
+# Postgres can't infer their type there.
+_APPEND_TURN_PAIR_SQL = sa.text(
+    """
+    WITH next AS (
+        SELECT coalesce(max(seq), -1) + 1 AS seq
+        FROM conversation_turns
+        WHERE conversation_id = :cid
+    ), ins AS (
+        INSERT INTO conversation_turns (conversation_id, seq, role, content)
+        SELECT :cid, next.seq + t.i, t.role, t.content
+        FROM next, (
+            VALUES (0, 'user', CAST(:user_text AS text)),
+                   (1, 'assistant', CAST(:assistant_text AS text))
+        ) AS t (i, role, content)
+        ON CONFLICT (conversation_id, seq) DO NOTHING
+        RETURNING seq
+    ), upd AS (
+        UPDATE conversations SET updated_at = now() WHERE id = :cid
+    )
+    SELECT min(seq), count(*) FROM ins
+    """
+)
+
+# Retries when a concurrent append wins the seq race.
+_APPEND_TURN_ATTEMPTS = 5
+
+# Above this many rows, bulk turn appends switch from one multi-row INSERT
+# to COPY (psycopg streams the rows without building a giant statement).
+_BULK_COPY_MIN_ROWS = 100
+
+# Rows fetched per server-side cursor round-trip when streaming turns.
+_STREAM_BATCH = 500
+
+
+class ConversationRow(NamedTuple):
+    id: UUID
+    user_id: UUID
+    avatar_id: UUID | None
+    created_at: dt.datetime
+    updated_at: dt.datetime
+
+
+class TurnRow(NamedTuple):
+    id: UUID
+    conversation_id: UUID
+    seq: int
+    role: str
+    content: str
+    created_at: dt.datetime
+
+
+def _with_tail(latest: sa.Select, lim: int) -> sa.Select:
+    """(id, role, content) of the latest conversation in `latest` and its tail."""
+    c = (
+        latest.order_by(Conversation.updated_at.desc(), Conversation.created_at.desc())
+        .limit(1)
+        .subquery("c")
+    )
+    t = (
+        sa.select(ConversationTurn.seq, ConversationTurn.role, ConversationTurn.content)
+        .where(ConversationTurn.conversation_id == c.c.id)
+        .order_by(ConversationTurn.seq.desc())
+        .limit(lim)
+        .lateral("t")
+    )
+    return (
+        sa.select(c.c.id, t.c.role, t.c.content)
+        .select_from(c)
+        .outerjoin(t, sa.true())
+        .order_by(t.c.seq.asc())
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class ConversationsRepository:
     async def list_for_user(
         self, session: AsyncSession, *, user_id: UUID, limit: int, offset: int
-    ) -> list[Conversation]:
-        stmt = (
-            sa.select(Conversation)
+    ) -> Sequence[sa.Row]:
+        stmt = sa.lambda_stmt(
+            lambda: sa.select(*_CONVERSATION_COLS)
             .where(Conversation.user_id == user_id)
             .order_by(Conversation.updated_at.desc(), Conversation.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         res = await session.execute(stmt)
-        return list(res.scalars().all())
+        return res.all()
 
-    async def get_for_user(
+    async def get_with_turns_for_user(
         self, session: AsyncSession, *, user_id: UUID, conversation_id: UUID
-    ) -> Conversation | None:
-        stmt = (
-            sa.select(Conversation)
+    ) -> tuple[ConversationRow | None, list[TurnRow]]:
+        """
+        Conversation + all its turns (seq order) in one round-trip.
+
+        LEFT JOIN so a conversation without turns still yields one row (with
+        NULL turn columns); no rows means not found / not owned.
+        """
+        nc = len(_CONVERSATION_COLS)
+        stmt = sa.lambda_stmt(
+            lambda: sa.select(*_CONVERSATION_COLS, *_TURN_COLS)
+            .select_from(Conversation)
+            .outerjoin(
+                ConversationTurn, ConversationTurn.conversation_id == Conversation.id
+            )
             .where(Conversation.id == conversation_id)
             .where(Conversation.user_id == user_id)
+            .order_by(ConversationTurn.seq.asc())
         )
-        res = await session.execute(stmt)
-        return res.scalar_one_or_none()
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return None, []
+        conversation = ConversationRow._make(rows[0][:nc])
+        turns = [TurnRow._make(r[nc:]) for r in rows if r[nc] is not None]
+        return conversation, turns
 
-    async def latest_for_user(
-        self, session: AsyncSession, *, user_id: UUID, avatar_id: UUID | None
-    ) -> Conversation | None:
-        stmt = sa.select(Conversation).where(Conversation.user_id == user_id)
-        if avatar_id is not None:
-            stmt = stmt.where(Conversation.avatar_id == avatar_id)
-        stmt = stmt.order_by(Conversation.updated_at.desc(), Conversation.created_at.desc()).limit(1)
+    async def exists_for_user(
+        self, session: AsyncSession, *, user_id: UUID, conversation_id: UUID
+    ) -> bool:
+        stmt = sa.lambda_stmt(
+            lambda: sa.select(
+                sa.exists()
+                .where(Conversation.id == conversation_id)
+                .where(Conversation.user_id == user_id)
+            )
+        )
         res = await session.execute(stmt)
-        return res.scalar_one_or_none()
+        return bool(res.scalar_one())
 
-    async def list_turns(
+    async def stream_turns(
         self, session: AsyncSession, *, conversation_id: UUID
-    ) -> list[ConversationTurn]:
+    ) -> AsyncIterator[TurnRow]:
+        """
+        All turns of a conversation in seq order, read through a server-side
+        cursor in batches so memory stays flat regardless of history length.
+        """
         stmt = (
-            sa.select(ConversationTurn)
+            sa.select(*_TURN_COLS)
             .where(ConversationTurn.conversation_id == conversation_id)
             .order_by(ConversationTurn.seq.asc())
+            .execution_options(yield_per=_STREAM_BATCH)
         )
-        res = await session.execute(stmt)
-        return list(res.scalars().all())
+        res = await session.stream(stmt)
+        async for row in res:
+            yield TurnRow._make(row)
 
-    async def list_turns_tail(
-        self, session: AsyncSession, *, conversation_id: UUID, limit: int
-    ) -> list[ConversationTurn]:
+    async def latest_with_tail(
+        self,
+        session: AsyncSession,
+        *,
+        user_id: UUID,
+        avatar_id: UUID | None,
+        limit: int,
+    ) -> tuple[UUID | None, list[tuple[str, str]]]:
         """
-        Fetch the last N turns for a conversation, returned in ascending seq order.
+        Latest conversation id plus (role, content) of its last N turns, in
+        ascending seq order, in one round-trip.
+
+        The tail is a LATERAL subquery on the single latest conversation, LEFT
+        joined so a conversation without turns still yields its id. This feeds
+        LLM context replay on every reply, so no ORM entities are built.
         """
         lim = max(0, int(limit))
-        if lim <= 0:
-            return []
-        stmt = (
-            sa.select(ConversationTurn)
-            .where(ConversationTurn.conversation_id == conversation_id)
-            .order_by(ConversationTurn.seq.desc())
-            .limit(lim)
+        stmt = sa.lambda_stmt(
+            lambda: sa.select(Conversation.id).where(Conversation.user_id == user_id)
         )
-        res = await session.execute(stmt)
-        rows = list(res.scalars().all())
-        rows.reverse()
-        return rows
+        if avatar_id is not None:
+            # Extending the lambda keeps one cached statement per branch.
+            stmt += lambda s: s.where(Conversation.avatar_id == avatar_id)
+        stmt += lambda s: _with_tail(s, lim)
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return None, []
+        return rows[0][0], [r[1:] for r in rows if r[1] is not None]
 
     async def create_conversation(
         self,
@@ -86,8 +225,8 @@ class ConversationsRepository:
         avatar_id: UUID | None,
     ) -> Conversation:
         now = dt.datetime.now(dt.UTC)
+        # id comes from the uuidv7() server default via RETURNING.
         c = Conversation(
-            id=uuid7_uuid(),
             user_id=user_id,
             avatar_id=avatar_id,
             created_at=now,
@@ -97,40 +236,92 @@ class ConversationsRepository:
         await session.flush()
         return c
 
-    async def next_seq(self, session: AsyncSession, *, conversation_id: UUID) -> int:
-        stmt = sa.select(sa.func.max(ConversationTurn.seq)).where(
-            ConversationTurn.conversation_id == conversation_id
+    async def append_turn_pair(
+        self,
+        session: AsyncSession,
+        *,
+        conversation_id: UUID,
+        user_text: str,
+        assistant_text: str,
+    ) -> int:
+        """
+        Append a user/assistant turn pair in one round-trip; returns the user
+        turn's seq.
+        """
+        params = {
+            "cid": conversation_id,
+            "user_text": user_text,
+            "assistant_text": assistant_text,
+        }
+        for _ in range(_APPEND_TURN_ATTEMPTS):
+            seq, inserted = (await session.execute(_APPEND_TURN_PAIR_SQL, params)).one()
+            if inserted == 2:
+                return int(seq)
+            if inserted:
+                # Only half the pair landed (a concurrent single-turn append
+                # took one seq); fail rather than split the pair. The caller
+                # never commits, so the stray row is rolled back.
+                break
+        raise ConversationsServiceException(
+            "Could not allocate a turn seq", TURN_SEQ_CONFLICT
         )
-        res = await session.execute(stmt)
-        max_seq = res.scalar_one_or_none()
-        return int(max_seq + 1) if max_seq is not None else 0
 
-    async def append_turn(
+    async def append_turns_bulk(
         self,
         session: AsyncSession,
         *,
         conversation_id: UUID,
-        seq: int,
-        role: str,
-        content: str,
-    ) -> ConversationTurn:
-        now = dt.datetime.now(dt.UTC)
-        t = ConversationTurn(
-            id=uuid7_uuid(),
-            conversation_id=conversation_id,
-            seq=seq,
-            role=role,
-            content=content,
-            created_at=now,
+        turns: Sequence[tuple[str, str]],
+    ) -> int:
+        """
+        Append (role, content) turns in order at consecutive seqs and touch the
+        conversation; returns the first seq used. For imports/replays, where
+        per-turn round-trips would dominate.
+
+        Not retried like append_turn_pair: a concurrent append into the same
+        conversation surfaces as a unique violation on (conversation_id, seq).
+        """
+        res = await session.execute(
+            sa.lambda_stmt(
+                lambda: sa.select(
+                    sa.func.coalesce(sa.func.max(ConversationTurn.seq) + 1, 0)
+                ).where(ConversationTurn.conversation_id == conversation_id)
+            )
         )
-        session.add(t)
-        # also touch conversation.updated_at
+        seq0 = int(res.scalar_one())
+        if not turns:
+            return seq0
+
+        if len(turns) >= _BULK_COPY_MIN_ROWS:
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            # Same connection/transaction as the session; id and created_at
+            # take their column defaults.
+            async with raw.driver_connection.cursor() as cur:
+                async with cur.copy(
+                    "COPY conversation_turns (conversation_id, seq, role, content) "
+                    "FROM STDIN"
+                ) as copy:
+                    for i, (role, content) in enumerate(turns):
+                        await copy.write_row((conversation_id, seq0 + i, role, content))
+        else:
+            await session.execute(
+                sa.insert(ConversationTurn).values(
+                    [
+                        {
+                            "conversation_id": conversation_id,
+                            "seq": seq0 + i,
+                            "role": role,
+                            "content": content,
+                        }
+                        for i, (role, content) in enumerate(turns)
+                    ]
+                )
+            )
+
         await session.execute(
             sa.update(Conversation)
             .where(Conversation.id == conversation_id)
-            .values(updated_at=now)
+            .values(updated_at=sa.func.now())
         )
-        await session.flush()
-        return t
-
-
+        return seq0
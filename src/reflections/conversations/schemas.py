@@ -4,13 +4,16 @@ from datetime import datetime
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field  # type: ignore[import-not-found]
+from pydantic import BaseModel, ConfigDict, Field  # type: ignore[import-not-found]
 
 
 TurnRole = Literal["user", "assistant", "system"]
 
 
 class ConversationPublic(BaseModel):
+    # Read-only views of DB rows, built internally via model_construct.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: UUID
     user_id: UUID
     avatar_id: UUID | None = None
@@ -19,6 +22,8 @@ class ConversationPublic(BaseModel):
 
 
 class ConversationTurnPublic(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: UUID
     conversation_id: UUID
     seq: int
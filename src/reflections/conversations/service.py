@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from functools import lru_cache
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
@@ -10,10 +10,12 @@ from reflections.conversations.exceptions import (
     CONVERSATION_NOT_FOUND,
     ConversationsServiceException,
 )
-from reflections.conversations.repository import ConversationsRepository
+from reflections.conversations.repository import ConversationsRepository, TurnRow
 
+_CHAT_ROLES = frozenset(("user", "assistant", "system"))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ConversationsService:
     repo: ConversationsRepository
 
@@ -31,14 +33,26 @@ class ConversationsService:
     async def get_conversation(
         self, session: AsyncSession, *, user, conversation_id: UUID
     ):
-        c = await self.repo.get_for_user(
+        c, turns = await self.repo.get_with_turns_for_user(
             session, user_id=user.id, conversation_id=conversation_id
         )
         if c is None:
             raise ConversationsServiceException("Conversation not found", CONVERSATION_NOT_FOUND)
-        turns = await self.repo.list_turns(session, conversation_id=conversation_id)
         return c, turns
 
+    async def stream_turns(
+        self, session: AsyncSession, *, user, conversation_id: UUID
+    ) -> AsyncIterator[TurnRow]:
+        # Ownership is checked up front so a 404 can still be returned before
+        # the response starts streaming.
+        if not await self.repo.exists_for_user(
+            session, user_id=user.id, conversation_id=conversation_id
+        ):
+            raise ConversationsServiceException(
+                "Conversation not found", CONVERSATION_NOT_FOUND
+            )
+        return self.repo.stream_turns(session, conversation_id=conversation_id)
+
     async def ensure_and_append_turn_pair(
         self,
         session: AsyncSession,
@@ -61,22 +75,13 @@ class ConversationsService:
             )
             cid = c.id
 
-        seq0 = await self.repo.next_seq(session, conversation_id=cid)
-        await self.repo.append_turn(
-            session,
-            conversation_id=cid,
-            seq=seq0,
-            role="user",
-            content=user_text,
-        )
-        await self.repo.append_turn(
+        await self.repo.append_turn_pair(
             session,
             conversation_id=cid,
-            seq=seq0 + 1,
-            role="assistant",
-            content=assistant_text,
+            user_text=user_text,
+            assistant_text=assistant_text,
         )
-        # The repo only flushes — without an explicit commit here the
+        # The repo never commits — without an explicit commit here the
         # turn pair gets rolled back when the session context closes,
         # so /voice never sees any history on nav-back. Matches the
         # pattern used by every other service in this codebase
@@ -97,29 +102,29 @@ class ConversationsService:
         chat messages (role/content).
 
         Scalability: this never scans thousands of conversations; it fetches the
-        single most-recent conversation and at most `limit_turns` rows.
+        single most-recent conversation and at most `limit_turns` rows, in one
+        query.
         """
-        c = await self.repo.latest_for_user(session, user_id=user_id, avatar_id=avatar_id)
-        if c is None:
-            return None, []
-        turns = await self.repo.list_turns_tail(
-            session, conversation_id=c.id, limit=limit_turns
+        cid, turns = await self.repo.latest_with_tail(
+            session, user_id=user_id, avatar_id=avatar_id, limit=limit_turns
         )
-        msgs: list[dict[str, str]] = []
-        for t in turns:
-            role = str(t.role or "").strip() or "user"
-            content = str(t.content or "").strip()
-            if not content:
-                continue
-            # Only allow known roles (Ollama expects user|assistant|system).
-            if role not in ("user", "assistant", "system"):
-                role = "user"
-            msgs.append({"role": role, "content": content})
-        return c.id, msgs
-
-
-@lru_cache
+        if cid is None:
+            return None, []
+        # Only allow known roles (Ollama expects user|assistant|system); both
+        # columns are NOT NULL text, so no str()/None guards are needed.
+        msgs = [
+            {"role": role if role in _CHAT_ROLES else "user", "content": content}
+            for role, raw in turns
+            if (content := raw.strip())
+        ]
+        return cid, msgs
+
+
+# Stateless, so built once at import; the API and the voice loop share it.
+_SERVICE = ConversationsService.create()
+
+
 def get_conversations_service() -> ConversationsService:
-    return ConversationsService.create()
+    return _SERVICE
 
 
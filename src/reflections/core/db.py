@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import (  # type: ignore[import-not-found]
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # type: ignore[import-not-found]
 
 from reflections.commons.exceptions import BaseCoreException
 from reflections.commons.logging import logger
@@ -31,21 +32,26 @@ class DatabaseManager:
         self.engine: AsyncEngine | None = None
         self.sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
-    def _build_dsn(self) -> str:
-        # psycopg async driver
-        return (
-            "postgresql+psycopg://"
-            f"{settings.REFLECTIONS_DB_USER}:{settings.REFLECTIONS_DB_PASSWORD}"
-            f"@{settings.REFLECTIONS_DB_HOST}:{settings.REFLECTIONS_DB_PORT}"
-            f"/{settings.REFLECTIONS_DB_NAME}"
-        )
-
     async def initialize(self) -> None:
         if self.engine is not None:
             return
         try:
-            dsn = self._build_dsn()
-            self.engine = create_async_engine(dsn, echo=False)
+            dsn = settings.database_dsn
+            # Multi-row INSERTs (add_all, insert().values([...])) are batched
+            # into multi-VALUES statements by SQLAlchemy's "insertmanyvalues"
+            # (psycopg3 has no executemany_mode knob; that is psycopg2-only).
+            # It's the 2.0 default; pinned here so it can't silently regress.
+            self.engine = create_async_engine(
+                dsn,
+                echo=False,
+                use_insertmanyvalues=True,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT_S,
+                pool_recycle=settings.DB_POOL_RECYCLE_S,
+                pool_pre_ping=settings.DB_POOL_PRE_PING,
+            )
             self.sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
             logger.info("Database initialized")
         except Exception as exc:
@@ -63,14 +69,13 @@ class DatabaseManager:
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         if self.sessionmaker is None:
             raise DatabaseException("Database is not initialized")
+        # AsyncSession.__aexit__ closes the session; no explicit close().
         async with self.sessionmaker() as session:
             try:
                 yield session
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
 
 
 database_manager = DatabaseManager()
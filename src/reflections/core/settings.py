@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import cached_property
+from typing import Literal
+
 from pydantic_settings import (  # type: ignore[import-not-found]
     BaseSettings,
     SettingsConfigDict,
@@ -27,6 +30,14 @@ class Settings(BaseSettings):
     REFLECTIONS_DB_NAME: str
     REFLECTIONS_DB_USER: str
     REFLECTIONS_DB_PASSWORD: str
+    # Connection pool (per worker process). Steady-state connections stay
+    # open; overflow covers bursts. Recycle/pre-ping drop connections the
+    # server or a NAT has closed instead of failing the request on them.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_S: float = 30.0
+    DB_POOL_RECYCLE_S: int = 1800
+    DB_POOL_PRE_PING: bool = True
 
     # Local model runtime (host-installed Ollama on Apple Silicon recommended)
     OLLAMA_BASE_URL: str
@@ -61,10 +72,22 @@ class Settings(BaseSettings):
     DIFFUSERS_DTYPE: str = "float32"  # float16|float32
     DIFFUSERS_HIGH_NOISE_FRAC: float = 0.8
     DIFFUSERS_ENABLE_COMPILE: bool = False
+    # Weight-only unet quantization via torchao (pip install torchao):
+    # none|int8|fp8 (fp8 needs Ada/Hopper). Check output parity before enabling.
+    DIFFUSERS_QUANTIZE: str = "none"
+    # Encoded output format: png|webp. WEBP encodes several times faster than
+    # PNG and is smaller (so is the base64 data URL), at quality 90 lossy.
+    DIFFUSERS_IMAGE_FORMAT: str = "png"
 
     # Memory integration
     MEMORY_AUTO_INGEST: bool = True
     MEMORY_CHUNK_TURN_WINDOW: int = 2
+    # Embedding runtime. onnx runs the model via ONNX Runtime
+    # (pip install "reflections[onnx]"); MEMORY_EMBEDDING_ONNX_FILE optionally
+    # picks an exported file in the model repo, e.g. an int8-quantized
+    # "onnx/model_qint8_avx512_vnni.onnx". Check recall parity before enabling.
+    MEMORY_EMBEDDING_BACKEND: Literal["torch", "onnx"] = "torch"
+    MEMORY_EMBEDDING_ONNX_FILE: str | None = None
 
     # Recall ranking (G1). All three layers default-on; flip individually
     # via env vars when A/B-ing or when running the eval harness.
@@ -75,6 +98,12 @@ class Settings(BaseSettings):
     RECALL_TIME_DECAY_ENABLED: bool = True
     RECALL_TIME_DECAY_HALF_LIFE_DAYS: float = 180.0
     RECALL_CANDIDATE_POOL: int = 50
+    # Semantic result cache: a query whose embedding is within this cosine
+    # similarity of a cached query (same user + filters) reuses its results.
+    # Off by default; near-identical phrasings can still ask different things.
+    RECALL_SEMANTIC_CACHE_ENABLED: bool = False
+    RECALL_SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    RECALL_SEMANTIC_CACHE_SIZE: int = 1024
 
     # Outbound egress (admin-only): optional HTTP proxy URL all outbound
     # calls route through when set. Leave unset for direct egress.
@@ -92,6 +121,10 @@ class Settings(BaseSettings):
     CATALOG_BRIDGE_SECRET: str | None = None
     CATALOG_BRIDGE_TIMEOUT_S: float = 30.0  # walks of large dirs need slack
 
+    # /health caches its probe results this long so liveness pollers don't
+    # fan out to every upstream on each hit. 0 disables.
+    HEALTH_CACHE_TTL_S: float = 1.0
+
     # Auth (HTTP-only cookie session)
     AUTH_COOKIE_NAME: str
     AUTH_COOKIE_SECURE: bool
@@ -102,5 +135,20 @@ class Settings(BaseSettings):
     # Include both hostnames since people often use either in the browser.
     CORS_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000"
 
+    @cached_property
+    def cors_origins(self) -> tuple[str, ...]:
+        """CORS_ORIGINS parsed once into a tuple (blank entries dropped)."""
+        return tuple(o for o in (p.strip() for p in self.CORS_ORIGINS.split(",")) if o)
+
+    @cached_property
+    def database_dsn(self) -> str:
+        """SQLAlchemy URL for the psycopg (v3) driver; built once per process."""
+        return (
+            "postgresql+psycopg://"
+            f"{self.REFLECTIONS_DB_USER}:{self.REFLECTIONS_DB_PASSWORD}"
+            f"@{self.REFLECTIONS_DB_HOST}:{self.REFLECTIONS_DB_PORT}"
+            f"/{self.REFLECTIONS_DB_NAME}"
+        )
+
 
 settings = Settings()
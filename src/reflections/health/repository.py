@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 import httpx  # type: ignore[import-not-found]
 import sqlalchemy as sa  # type: ignore[import-not-found]
@@ -8,6 +9,9 @@ import sqlalchemy as sa  # type: ignore[import-not-found]
 from reflections.core.db import database_manager
 from reflections.core.settings import settings
 
+# Built once; the liveness probe reuses the same clause every call.
+_PING = sa.text("SELECT 1")
+
 
 def get_ollama_base_url() -> str:
     return settings.OLLAMA_BASE_URL
@@ -15,28 +19,60 @@ def get_ollama_base_url() -> str:
 
 async def check_db() -> tuple[bool, str | None]:
     try:
-        await database_manager.initialize()
+        # Normally the app lifespan has already built the engine; a process
+        # that hasn't (e.g. no lifespan ran) connects once here instead of
+        # reporting the DB as down.
+        if database_manager.sessionmaker is None:
+            await database_manager.initialize()
         async with database_manager.session() as session:
-            await session.execute(sa.text("SELECT 1"))
+            await session.execute(_PING)
         return True, None
     except Exception as exc:
         return False, str(exc)
 
 
+# One keep-alive client per probed base URL, so repeated /health calls reuse
+# connections instead of reconnecting each time. Built lazily (binds to the
+# running loop); closed from the app lifespan.
+_http_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _http_client(base_url: str) -> httpx.AsyncClient:
+    client = _http_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+        )
+        _http_clients[base_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+@lru_cache(maxsize=8)
+def _probe_timeout(timeout_s: float) -> httpx.Timeout:
+    # Probes use a handful of fixed budgets; build each Timeout once.
+    return httpx.Timeout(timeout_s, connect=min(0.25, timeout_s))
+
+
 async def check_http_ok(
     base_url: str, *, path: str, timeout_s: float, accept_404: bool = False
 ) -> tuple[bool, str | None]:
     try:
-        timeout = httpx.Timeout(timeout_s, connect=min(0.25, timeout_s))
-        async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
-            resp = await client.get(path)
-            # Consider any 2xx/3xx as "reachable".
-            if 200 <= int(resp.status_code) < 400:
-                return True, None
-            # Some local bridges don't implement /health; treat 404 as reachable.
-            if accept_404 and int(resp.status_code) == 404:
-                return True, None
-            return False, f"HTTP {resp.status_code}"
+        resp = await _http_client(base_url).get(path, timeout=_probe_timeout(timeout_s))
+        # Consider any 2xx/3xx as "reachable".
+        if 200 <= int(resp.status_code) < 400:
+            return True, None
+        # Some local bridges don't implement /health; treat 404 as reachable.
+        if accept_404 and int(resp.status_code) == 404:
+            return True, None
+        return False, f"HTTP {resp.status_code}"
     except Exception as exc:
         return False, str(exc)
 
@@ -1,15 +1,71 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
+from reflections.core.settings import settings
 from reflections.health import repository
 
+# (expires_at on the monotonic clock, payload). Pollers within the TTL share
+# one probe cycle; the lock makes concurrent misses wait for a single run.
+_cached: tuple[float, dict] | None = None
+_lock = asyncio.Lock()
+
+
+_NOT_CONFIGURED: tuple[bool, str | None] = (False, "not_configured")
+
+
+def _probe_result(
+    res: tuple[bool, str | None] | BaseException,
+) -> tuple[bool, str | None]:
+    if isinstance(res, BaseException):
+        return False, str(res)
+    return res
+
 
 async def get_health_payload() -> dict:
-    db_ok, db_detail = await repository.check_db()
-    ollama_ok, ollama_detail = await repository.check_ollama()
-    stt_ok, stt_detail = await repository.check_stt()
-    tts_ok, tts_detail = await repository.check_tts()
+    global _cached
+    ttl = settings.HEALTH_CACHE_TTL_S
+    if ttl <= 0:
+        return await _probe_payload()
+    cached = _cached
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    async with _lock:
+        cached = _cached
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        payload = await _probe_payload()
+        _cached = (time.monotonic() + ttl, payload)
+        return payload
+
+
+async def _probe_payload() -> dict:
+    cfg = repository.settings
+    a1111_engine = (cfg.AVATAR_IMAGE_ENGINE or "").strip().lower() == "a1111"
+
+    # Probes are independent network round-trips (each with its own short
+    # timeout); run them concurrently so /health costs the slowest, not the sum.
+    # Unconfigured optional services aren't scheduled at all.
+    probes = {
+        "db": repository.check_db(),
+        "ollama": repository.check_ollama(),
+    }
+    if cfg.STT_BASE_URL:
+        probes["stt"] = repository.check_stt()
+    if cfg.TTS_BASE_URL:
+        probes["tts"] = repository.check_tts()
+    if a1111_engine and cfg.A1111_BASE_URL:
+        probes["a1111"] = repository.check_a1111()
+    results = await asyncio.gather(*probes.values(), return_exceptions=True)
+    checks = dict(zip(probes, map(_probe_result, results), strict=True))
+
+    db_ok, db_detail = checks["db"]
+    ollama_ok, ollama_detail = checks["ollama"]
+    stt_ok, stt_detail = checks.get("stt", _NOT_CONFIGURED)
+    tts_ok, tts_detail = checks.get("tts", _NOT_CONFIGURED)
+    a1111_ok, a1111_detail = checks.get("a1111", _NOT_CONFIGURED)
     avatar_ok, avatar_detail = repository.check_avatar_image_engine()
-    a1111_ok, a1111_detail = await repository.check_a1111()
 
     # Overall status: only DB is mandatory for the API to function.
     # Optional services can be down; we reflect that in the per-service checks.
@@ -66,7 +122,7 @@ async def get_health_payload() -> dict:
                 "base_url": repository.settings.A1111_BASE_URL,
                 "detail": a1111_detail,
             }
-            if (repository.settings.AVATAR_IMAGE_ENGINE or "").strip().lower() == "a1111"
+            if a1111_engine
             else {
                 "ok": avatar_ok,
                 "configured": True,
@@ -11,7 +11,7 @@ from pydantic import Field
 from reflections.core.db import database_manager
 from reflections.mcp.auth import can_read_private, current_user_id
 from reflections.memory.schemas import Turn
-from reflections.memory.service import MemoryService
+from reflections.memory.service import MemoryService, invalidate_recall_cache
 
 _memory_service: MemoryService | None = None
 
@@ -64,6 +64,7 @@ def register(mcp) -> None:  # type: ignore[no-untyped-def]
                     embedding=emb,
                 )
                 await session.commit()
+                invalidate_recall_cache(user_id)
                 # Run extraction best-effort against the card text too.
                 if svc.entities is not None:
                     try:
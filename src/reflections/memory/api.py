@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from datetime import datetime
-from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 
@@ -32,16 +31,11 @@ from reflections.memory.schemas import (
     SearchMemoryRequest,
     SearchMemoryResponse,
 )
-from reflections.memory.service import MemoryService
+from reflections.memory.service import MemoryService, get_memory_service
 
 router = APIRouter(prefix="/memory", tags=["memory"])
 
 
-@lru_cache
-def get_memory_service() -> MemoryService:
-    return MemoryService.create()
-
-
 def _to_linked(rows: list[LinkedEntityRow]) -> list[LinkedEntity]:
     return [
         LinkedEntity(id=r.id, kind=r.kind, name=r.name, slug=r.slug)  # type: ignore[arg-type]
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, Literal, NamedTuple
 from uuid import UUID
 
+import numpy as np  # type: ignore[import-not-found]
 import sqlalchemy as sa  # type: ignore[import-not-found]
+from pgvector.sqlalchemy import HALFVEC, Vector  # type: ignore[import-not-found]
+from pgvector.utils import Vector as PgVector  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 
 from reflections.artifacts.repository import (
@@ -20,10 +23,30 @@ from reflections.entities.repository import (
 
 MemoryScope = Literal["user", "avatar"]
 MemoryKind = Literal["card", "chunk"]
+# What the service's embedder returns; pgvector's Vector binds either form.
+Embedding = np.ndarray | list[float]
 
+# Matches the vector(384) column created by migration 0001.
+EMBEDDING_DIM = 384
+
+# The HNSW index is over embedding::halfvec (migration 0022). The vector leg
+# pulls this many times the requested candidates from it, then re-scores
+# them against the full-precision column.
+_RESCORE_OVERSAMPLE = 4
+
+# From this many rows, bulk inserts switch from one multi-row INSERT to COPY
+# (no statement to parse/plan, rows streamed by psycopg).
+_BULK_COPY_MIN_ROWS = 16
+
+# pgvector's HNSW default ef_search (40) caps how many rows one index scan
+# can return; size it to the oversampled pool instead. 1000 is pgvector's max.
+_EF_SEARCH_MIN = 40
+_EF_SEARCH_MAX = 1000
+
+
+class MemoryRow(NamedTuple):
+    """Field order matches _MEMORY_ROW_COLS, so rows load via MemoryRow._make."""
 
-@dataclass(frozen=True)
-class MemoryRow:
     id: UUID
     user_id: UUID
     avatar_id: UUID | None
@@ -66,9 +89,10 @@ memory_items = sa.Table(
     sa.Column("scope", sa.Text(), nullable=False),
     sa.Column("kind", sa.Text(), nullable=False),
     sa.Column("content", sa.Text(), nullable=False),
-    # We store as pgvector in Postgres; for type-checking we keep as Text here and
-    # rely on raw SQL operator usage.
-    sa.Column("embedding", sa.Text(), nullable=False),
+    # Full-precision vector(384). Indexed by an HNSW halfvec_ip_ops expression
+    # index on embedding::halfvec(384) (migration 0022); vector_candidates
+    # searches that and re-scores the candidates against this column.
+    sa.Column("embedding", Vector(EMBEDDING_DIM), nullable=False),
     sa.Column(
         "created_at",
         sa.DateTime(timezone=True),
@@ -88,6 +112,20 @@ memory_items = sa.Table(
 )
 
 
+# The MemoryRow projection; selects put these first so a result row (or its
+# leading slice, when extra columns follow) maps straight onto MemoryRow.
+_MEMORY_ROW_COLS = (
+    memory_items.c.id,
+    memory_items.c.user_id,
+    memory_items.c.avatar_id,
+    memory_items.c.scope,
+    memory_items.c.kind,
+    memory_items.c.content,
+    memory_items.c.created_at,
+)
+_N_ROW_COLS = len(_MEMORY_ROW_COLS)
+
+
 class MemoryRepository:
     async def list_items(
         self,
@@ -129,15 +167,7 @@ class MemoryRepository:
             conditions.append(sa.or_(*kind_conds))
 
         stmt = (
-            sa.select(
-                memory_items.c.id,
-                memory_items.c.user_id,
-                memory_items.c.avatar_id,
-                memory_items.c.scope,
-                memory_items.c.kind,
-                memory_items.c.content,
-                memory_items.c.created_at,
-            )
+            sa.select(*_MEMORY_ROW_COLS)
             .where(sa.and_(*conditions))
             .order_by(memory_items.c.created_at.desc())
             .limit(limit)
@@ -145,18 +175,7 @@ class MemoryRepository:
         )
 
         rows = (await session.execute(stmt)).all()
-        return [
-            MemoryRow(
-                id=r.id,
-                user_id=r.user_id,
-                avatar_id=r.avatar_id,
-                scope=r.scope,
-                kind=r.kind,
-                content=r.content,
-                created_at=r.created_at,
-            )
-            for r in rows
-        ]
+        return [MemoryRow._make(r) for r in rows]
 
     async def delete_items(
         self,
@@ -181,7 +200,7 @@ class MemoryRepository:
         scope: MemoryScope,
         kind: MemoryKind,
         content: str,
-        embedding: list[float],
+        embedding: Embedding,
         source_session_id: str | None = None,
         metadata: dict[str, Any] | None = None,
         artifact_id: UUID | None = None,
@@ -194,11 +213,6 @@ class MemoryRepository:
         No error handling here; service owns exceptions/transactions.
         """
         item_id = uuid7_uuid()
-        # Pass embedding as pgvector literal: '[0.1,0.2,...]'
-        embedding_literal = "[" + ",".join(f"{x:.8f}" for x in embedding) + "]"
-        # IMPORTANT: The Postgres column type is `vector`, so we must explicitly
-        # cast the literal; otherwise SQLAlchemy will bind it as VARCHAR.
-        embedding_expr = sa.literal_column(f"'{embedding_literal}'::vector")
         stmt = (
             sa.insert(memory_items)
             .values(
@@ -208,7 +222,7 @@ class MemoryRepository:
                 scope=scope,
                 kind=kind,
                 content=content,
-                embedding=embedding_expr,
+                embedding=embedding,
                 source_session_id=source_session_id,
                 artifact_id=artifact_id,
                 artifact_locator=artifact_locator,
@@ -221,6 +235,73 @@ class MemoryRepository:
         await session.flush()
         return res.scalar_one()
 
+    async def insert_items_bulk(
+        self,
+        session: AsyncSession,
+        *,
+        user_id: UUID,
+        avatar_id: UUID | None,
+        items: list[tuple[MemoryScope, MemoryKind, str, Embedding]],
+    ) -> list[UUID]:
+        """
+        Insert (scope, kind, content, embedding) rows; returns their ids in
+        input order. Small batches use one multi-row INSERT, larger ones COPY.
+
+        Ids are generated here, so no RETURNING is needed to map them back.
+        No error handling here; service owns exceptions/transactions.
+        """
+        if not items:
+            return []
+        ids = [uuid7_uuid() for _ in items]
+
+        if len(items) >= _BULK_COPY_MIN_ROWS:
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            # Same connection/transaction as the session. Text-format COPY
+            # takes vectors in their '[x,y,...]' input form; the remaining
+            # columns (created_at, private, content_tsv, ...) use defaults.
+            async with raw.driver_connection.cursor() as cur:
+                async with cur.copy(
+                    "COPY memory_items "
+                    "(id, user_id, avatar_id, scope, kind, content, embedding) "
+                    "FROM STDIN"
+                ) as copy:
+                    for item_id, (scope, kind, content, embedding) in zip(
+                        ids, items, strict=True
+                    ):
+                        await copy.write_row(
+                            (
+                                item_id,
+                                user_id,
+                                avatar_id,
+                                scope,
+                                kind,
+                                content,
+                                PgVector(embedding).to_text(),
+                            )
+                        )
+            return ids
+
+        await session.execute(
+            sa.insert(memory_items).values(
+                [
+                    {
+                        "id": item_id,
+                        "user_id": user_id,
+                        "avatar_id": avatar_id,
+                        "scope": scope,
+                        "kind": kind,
+                        "content": content,
+                        "embedding": embedding,
+                    }
+                    for item_id, (scope, kind, content, embedding) in zip(
+                        ids, items, strict=True
+                    )
+                ]
+            )
+        )
+        return ids
+
     def _filter_conditions(
         self,
         *,
@@ -289,7 +370,7 @@ class MemoryRepository:
         *,
         user_id: UUID,
         avatar_id: UUID | None,
-        query_embedding: list[float],
+        query_embedding: Embedding,
         limit: int,
         include_user_scope: bool,
         include_avatar_scope: bool,
@@ -307,7 +388,6 @@ class MemoryRepository:
         positive similarity (so larger == more similar) to match the
         BM25 leg's convention.
         """
-        emb_lit = "[" + ",".join(f"{x:.8f}" for x in query_embedding) + "]"
         conditions = self._filter_conditions(
             user_id=user_id,
             avatar_id=avatar_id,
@@ -321,19 +401,38 @@ class MemoryRepository:
             include_private=include_private,
         )
 
-        distance_expr = sa.literal_column(f"(embedding <#> '{emb_lit}'::vector)")
+        # Bound as a vector parameter (not an inlined literal) so the
+        # statement text is stable. The inner ORDER BY matches the halfvec
+        # index expression; the outer one re-ranks with full precision.
+        query_vec = sa.bindparam(
+            "query_embedding", query_embedding, type_=Vector(EMBEDDING_DIM)
+        )
+        halfvec = HALFVEC(EMBEDDING_DIM)
+        oversample = limit * _RESCORE_OVERSAMPLE
+        await session.execute(
+            sa.text("SELECT set_config('hnsw.ef_search', :ef, true)"),
+            {"ef": str(min(_EF_SEARCH_MAX, max(_EF_SEARCH_MIN, oversample)))},
+        )
+        cand = (
+            sa.select(
+                *_MEMORY_ROW_COLS,
+                memory_items.c.embedding,
+            )
+            .where(sa.and_(*conditions))
+            .order_by(
+                sa.cast(memory_items.c.embedding, halfvec)
+                .op("<#>", return_type=sa.Float)(sa.cast(query_vec, halfvec))
+                .asc()
+            )
+            .limit(oversample)
+            .subquery("cand")
+        )
+        distance_expr = cand.c.embedding.max_inner_product(query_vec)
         stmt = (
             sa.select(
-                memory_items.c.id,
-                memory_items.c.user_id,
-                memory_items.c.avatar_id,
-                memory_items.c.scope,
-                memory_items.c.kind,
-                memory_items.c.content,
-                memory_items.c.created_at,
+                *(cand.c[c.name] for c in _MEMORY_ROW_COLS),
                 distance_expr.label("distance"),
             )
-            .where(sa.and_(*conditions))
             .order_by(distance_expr.asc())
             .limit(limit)
         )
@@ -343,15 +442,7 @@ class MemoryRepository:
         for rank, r in enumerate(rows, start=1):
             # `<#>` returns negative inner product; flip sign so larger == better.
             score = -float(r.distance) if r.distance is not None else 0.0
-            row = MemoryRow(
-                id=r.id,
-                user_id=r.user_id,
-                avatar_id=r.avatar_id,
-                scope=r.scope,
-                kind=r.kind,
-                content=r.content,
-                created_at=r.created_at,
-            )
+            row = MemoryRow._make(r[:_N_ROW_COLS])
             out.append(MemoryCandidate(row=row, score=score, rank=rank))
         return out
 
@@ -403,13 +494,7 @@ class MemoryRepository:
 
         stmt = (
             sa.select(
-                memory_items.c.id,
-                memory_items.c.user_id,
-                memory_items.c.avatar_id,
-                memory_items.c.scope,
-                memory_items.c.kind,
-                memory_items.c.content,
-                memory_items.c.created_at,
+                *_MEMORY_ROW_COLS,
                 rank_expr.label("bm25_score"),
             )
             .where(sa.and_(*conditions))
@@ -421,15 +506,7 @@ class MemoryRepository:
         out: list[MemoryCandidate] = []
         for rank, r in enumerate(rows, start=1):
             score = float(r.bm25_score) if r.bm25_score is not None else 0.0
-            row = MemoryRow(
-                id=r.id,
-                user_id=r.user_id,
-                avatar_id=r.avatar_id,
-                scope=r.scope,
-                kind=r.kind,
-                content=r.content,
-                created_at=r.created_at,
-            )
+            row = MemoryRow._make(r[:_N_ROW_COLS])
             out.append(MemoryCandidate(row=row, score=score, rank=rank))
         return out
 
@@ -481,11 +558,9 @@ class MemoryRepository:
         user_id: UUID,
         memory_id: UUID,
         content: str,
-        embedding: list[float],
+        embedding: Embedding,
     ) -> int:
         """Replace the content + embedding of a memory the caller owns."""
-        emb_lit = "[" + ",".join(f"{x:.8f}" for x in embedding) + "]"
-        emb_expr = sa.literal_column(f"'{emb_lit}'::vector")
         stmt = (
             sa.update(memory_items)
             .where(
@@ -494,7 +569,7 @@ class MemoryRepository:
                     memory_items.c.user_id == user_id,
                 )
             )
-            .values(content=content, embedding=emb_expr)
+            .values(content=content, embedding=embedding)
         )
         res = await session.execute(stmt)
         await session.flush()
@@ -507,15 +582,7 @@ class MemoryRepository:
         user_id: UUID,
         memory_id: UUID,
     ) -> MemoryRow | None:
-        stmt = sa.select(
-            memory_items.c.id,
-            memory_items.c.user_id,
-            memory_items.c.avatar_id,
-            memory_items.c.scope,
-            memory_items.c.kind,
-            memory_items.c.content,
-            memory_items.c.created_at,
-        ).where(
+        stmt = sa.select(*_MEMORY_ROW_COLS).where(
             sa.and_(
                 memory_items.c.id == memory_id,
                 memory_items.c.user_id == user_id,
@@ -524,15 +591,7 @@ class MemoryRepository:
         r = (await session.execute(stmt)).first()
         if r is None:
             return None
-        return MemoryRow(
-            id=r.id,
-            user_id=r.user_id,
-            avatar_id=r.avatar_id,
-            scope=r.scope,
-            kind=r.kind,
-            content=r.content,
-            created_at=r.created_at,
-        )
+        return MemoryRow._make(r)
 
     async def graph(
         self,
@@ -584,13 +643,7 @@ class MemoryRepository:
 
         mem_stmt = (
             sa.select(
-                memory_items.c.id,
-                memory_items.c.user_id,
-                memory_items.c.avatar_id,
-                memory_items.c.scope,
-                memory_items.c.kind,
-                memory_items.c.content,
-                memory_items.c.created_at,
+                *_MEMORY_ROW_COLS,
                 memory_items.c.artifact_id,
             )
             .where(sa.and_(*mem_conds))
@@ -598,18 +651,7 @@ class MemoryRepository:
             .limit(limit_memories)
         )
         raw_mems = (await session.execute(mem_stmt)).all()
-        mem_rows = [
-            MemoryRow(
-                id=r.id,
-                user_id=r.user_id,
-                avatar_id=r.avatar_id,
-                scope=r.scope,
-                kind=r.kind,
-                content=r.content,
-                created_at=r.created_at,
-            )
-            for r in raw_mems
-        ]
+        mem_rows = [MemoryRow._make(r[:_N_ROW_COLS]) for r in raw_mems]
         # Track memory→artifact links so we can draw edges later.
         mem_art_edges: list[tuple[UUID, UUID]] = [
             (r.id, r.artifact_id)
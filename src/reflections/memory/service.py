@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import math
-from dataclasses import dataclass
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+import numpy as np  # type: ignore[import-not-found]
 from sentence_transformers import SentenceTransformer  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 
@@ -18,6 +23,7 @@ from reflections.memory.exceptions import (
     MemoryUnprocessableException,
 )
 from reflections.memory.repository import (
+    EMBEDDING_DIM,  # noqa: F401  (re-exported; the dim lives with the column)
     LinkedEntityRow,
     MemoryCandidate,
     MemoryRepository,
@@ -29,14 +35,10 @@ if TYPE_CHECKING:
     from sentence_transformers import CrossEncoder  # type: ignore[import-not-found]
 
 EMBEDDING_MODEL_ID = "BAAI/bge-small-en-v1.5"
-EMBEDDING_DIM = 384
-
-
-def _normalize(vec: list[float]) -> list[float]:
-    norm = math.sqrt(sum(x * x for x in vec))
-    if norm == 0:
-        return vec
-    return [x / norm for x in vec]
+# Texts per forward pass when embedding a batch (cards + chunks on ingest).
+EMBED_BATCH_SIZE = 32
+# Embeddings kept per service, LRU-evicted; repeat queries skip the model.
+EMBED_CACHE_SIZE = 4096
 
 
 def _fuse_rrf(
@@ -122,6 +124,87 @@ async def _rerank_with_cross_encoder(
     return out
 
 
+class _RecallCache:
+    """
+    Recent search results keyed by (user, filters) and matched on query
+    embedding similarity, so a near-duplicate query skips both retrieval
+    legs and the rerank.
+
+    Only touched from the event loop, so no lock. Writes drop the user's
+    entries and bump their generation; a search that was already running
+    when the write landed sees the new generation and doesn't store.
+    """
+
+    def __init__(self) -> None:
+        # entry id -> (user_id, filter key, generation, query vec, results)
+        self._entries: OrderedDict[
+            int, tuple[UUID, tuple[Any, ...], int, np.ndarray, list[MemoryRow]]
+        ] = OrderedDict()
+        self._generations: dict[UUID, int] = {}
+        self._next_id = 0
+
+    def generation(self, user_id: UUID) -> int:
+        return self._generations.get(user_id, 0)
+
+    def get(
+        self,
+        user_id: UUID,
+        key: tuple[Any, ...],
+        query: np.ndarray,
+        *,
+        threshold: float,
+    ) -> list[MemoryRow] | None:
+        gen = self.generation(user_id)
+        ids: list[int] = []
+        vecs: list[np.ndarray] = []
+        for eid, (uid, k, g, vec, _rows) in self._entries.items():
+            if uid == user_id and g == gen and k == key:
+                ids.append(eid)
+                vecs.append(vec)
+        if not ids:
+            return None
+        # Vectors are L2-normalized, so the dot product is cosine similarity.
+        sims = np.stack(vecs) @ query
+        best = int(np.argmax(sims))
+        if float(sims[best]) < threshold:
+            return None
+        eid = ids[best]
+        self._entries.move_to_end(eid)
+        return list(self._entries[eid][4])
+
+    def put(
+        self,
+        user_id: UUID,
+        key: tuple[Any, ...],
+        query: np.ndarray,
+        rows: list[MemoryRow],
+        *,
+        generation: int,
+        capacity: int,
+    ) -> None:
+        if generation != self.generation(user_id):
+            return
+        self._entries[self._next_id] = (user_id, key, generation, query, list(rows))
+        self._next_id += 1
+        while len(self._entries) > capacity:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._generations[user_id] = self.generation(user_id) + 1
+        for eid in [e for e, entry in self._entries.items() if entry[0] == user_id]:
+            del self._entries[eid]
+
+
+# Shared by every MemoryService instance (the API's and the MCP tools') so a
+# write through either invalidates results cached by both.
+_RECALL_CACHE = _RecallCache()
+
+
+def invalidate_recall_cache(user_id: UUID) -> None:
+    """Drop cached search results for a user; call after writing their memories."""
+    _RECALL_CACHE.invalidate(user_id)
+
+
 def chunk_turns_by_window(turns: list[Turn], window: int) -> list[str]:
     """
     Group consecutive turns into windowed chunks of plain text.
@@ -200,6 +283,27 @@ def user_only_text(chunk_text: str) -> str:
     return "\n".join(user_lines).strip()
 
 
+# High-signal phrases for heuristic cards, matched as case-insensitive
+# substrings in one pass (same semantics as the old per-needle `in` checks).
+_CARD_NEEDLES_RE = re.compile(
+    "|".join(
+        re.escape(n)
+        for n in (
+            "i like",
+            "i prefer",
+            "my ",
+            "i am ",
+            "i'm ",
+            "we are ",
+            "we're ",
+            "we will ",
+            "we want ",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
 def extract_memory_cards_heuristic(turns: list[Turn]) -> list[str]:
     """
     Heuristic v0: extract a few high-signal sentences.
@@ -214,23 +318,9 @@ def extract_memory_cards_heuristic(turns: list[Turn]) -> list[str]:
         return []
 
     candidates: list[str] = []
-    needles = [
-        "i like",
-        "i prefer",
-        "my ",
-        "i am ",
-        "i'm ",
-        "we are ",
-        "we're ",
-        "we will ",
-        "we want ",
-    ]
     for sentence in joined.replace("\n", " ").split("."):
         s = sentence.strip()
-        if not s:
-            continue
-        low = s.lower()
-        if any(n in low for n in needles):
+        if s and _CARD_NEEDLES_RE.search(s):
             candidates.append(s)
 
     # Deduplicate + cap
@@ -251,21 +341,74 @@ class MemoryService:
     repository: MemoryRepository
     embedder: SentenceTransformer
     entities: EntitiesService | None = None
+    # sha256(text) -> embedding. Keyed by digest so long chunks aren't held
+    # twice; the lock covers concurrent callers (threadpool, to_thread).
+    _embed_cache: OrderedDict[bytes, np.ndarray] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _embed_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
     @classmethod
     def create(cls) -> MemoryService:
         # normalize_embeddings=True gives us cosine==dot if vectors are normalized
-        embedder = SentenceTransformer(EMBEDDING_MODEL_ID)
+        kwargs: dict[str, Any] = {}
+        if settings.MEMORY_EMBEDDING_BACKEND == "onnx":
+            # Same model and outputs, run through ONNX Runtime (int8 kernels
+            # when a quantized file is selected) instead of fp32 torch.
+            kwargs["backend"] = "onnx"
+            if settings.MEMORY_EMBEDDING_ONNX_FILE:
+                kwargs["model_kwargs"] = {
+                    "file_name": settings.MEMORY_EMBEDDING_ONNX_FILE
+                }
+        embedder = SentenceTransformer(EMBEDDING_MODEL_ID, **kwargs)
         return cls(
             repository=MemoryRepository(),
             embedder=embedder,
             entities=EntitiesService.create(),
         )
 
-    def embed_text(self, text: str) -> list[float]:
-        vec = self.embedder.encode([text], normalize_embeddings=True)[0].tolist()
-        # Defensive: ensure normalized even if upstream settings change
-        return _normalize([float(x) for x in vec])
+    def embed_text(self, text: str) -> np.ndarray:
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> list[np.ndarray]:
+        """
+        Embed many texts in batched forward passes. Vectors come back as
+        read-only float32 arrays, L2-normalized (normalize_embeddings=True)
+        so cosine == dot; pgvector binds them as-is.
+
+        Cached texts are served from the LRU; only misses reach the model.
+        """
+        if not texts:
+            return []
+        keys = [hashlib.sha256(t.encode()).digest() for t in texts]
+        out: list[np.ndarray | None] = [None] * len(texts)
+        cache = self._embed_cache
+        with self._embed_lock:
+            for i, key in enumerate(keys):
+                vec = cache.get(key)
+                if vec is not None:
+                    cache.move_to_end(key)
+                    out[i] = vec
+
+        misses = [i for i, vec in enumerate(out) if vec is None]
+        if misses:
+            vecs = self.embedder.encode(
+                [texts[i] for i in misses],
+                batch_size=EMBED_BATCH_SIZE,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+            )
+            # Cached rows are shared between callers; keep them immutable.
+            vecs.setflags(write=False)
+            with self._embed_lock:
+                for i, vec in zip(misses, vecs, strict=True):
+                    out[i] = vec
+                    cache[keys[i]] = vec
+                while len(cache) > EMBED_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return out  # type: ignore[return-value]
 
     async def ingest_episodic(
         self,
@@ -302,49 +445,35 @@ class MemoryService:
             # erroring (e.g. an assistant-only greet that triggered ingest).
             return [], 0, 0
 
-        stored_ids: list[UUID] = []
         cards = extract_memory_cards_heuristic(user_turns)
         raw_chunks = chunk_turns_by_window(user_turns, chunk_turn_window)
 
+        scope = "avatar" if avatar_id else "user"
         try:
-            # Memory cards
-            for c in cards:
-                scope = "avatar" if avatar_id else "user"
-                emb = self.embed_text(c)
-                stored_ids.append(
-                    await self.repository.insert_item(
-                        session,
-                        user_id=user_id,
-                        avatar_id=avatar_id,
-                        scope=scope,
-                        kind="card",
-                        content=c,
-                        embedding=emb,
-                    )
-                )
-
-            # Raw chunks (always avatar-scoped if avatar_id exists, else user-scoped)
+            # One batched encode for every card and chunk.
+            texts = cards + raw_chunks
+            embs = self.embed_texts(texts)
+            # Cards, then raw chunks (avatar-scoped if avatar_id exists, else
+            # user-scoped), all in one INSERT.
+            stored_ids = await self.repository.insert_items_bulk(
+                session,
+                user_id=user_id,
+                avatar_id=avatar_id,
+                items=[
+                    (scope, "card" if i < len(cards) else "chunk", text, emb)
+                    for i, (text, emb) in enumerate(zip(texts, embs, strict=True))
+                ],
+            )
             # Track chunk_id -> chunk_text for later entity extraction.
-            chunk_id_to_text: list[tuple[UUID, str]] = []
-            for ch in raw_chunks:
-                scope = "avatar" if avatar_id else "user"
-                emb = self.embed_text(ch)
-                new_id = await self.repository.insert_item(
-                    session,
-                    user_id=user_id,
-                    avatar_id=avatar_id,
-                    scope=scope,
-                    kind="chunk",
-                    content=ch,
-                    embedding=emb,
-                )
-                stored_ids.append(new_id)
-                chunk_id_to_text.append((new_id, ch))
+            chunk_id_to_text = list(
+                zip(stored_ids[len(cards) :], raw_chunks, strict=True)
+            )
 
             await session.commit()
         except Exception as exc:
             await session.rollback()
             raise MemoryServiceException("Failed to ingest memory", str(exc)) from exc
+        invalidate_recall_cache(user_id)
 
         # Best-effort entity extraction. Failures here must never break ingest.
         # IMPORTANT: extract from user-attributed text only, so the assistant's
@@ -436,6 +565,38 @@ class MemoryService:
 
         try:
             q_emb = self.embed_text(query)
+
+            # Entity-filtered searches aren't cached: entity links change
+            # outside the memory write paths that invalidate the cache.
+            cache_on = settings.RECALL_SEMANTIC_CACHE_ENABLED and not entity_ids
+            if cache_on:
+                cache_key = (
+                    avatar_id,
+                    top_k,
+                    include_user_scope,
+                    include_avatar_scope,
+                    include_cards,
+                    include_chunks,
+                    date_from,
+                    date_to,
+                    include_private,
+                    hybrid,
+                    rerank,
+                    decay,
+                    pool,
+                    k_rrf,
+                    half_life,
+                )
+                generation = _RECALL_CACHE.generation(user_id)
+                cached = _RECALL_CACHE.get(
+                    user_id,
+                    cache_key,
+                    q_emb,
+                    threshold=settings.RECALL_SEMANTIC_CACHE_THRESHOLD,
+                )
+                if cached is not None:
+                    return cached
+
             vector_leg = await self.repository.vector_candidates(
                 session,
                 user_id=user_id,
@@ -489,7 +650,17 @@ class MemoryService:
                     model_id=settings.RECALL_RERANKER_MODEL,
                 )
 
-            return [row for row, _ in scored[:top_k]]
+            results = [row for row, _ in scored[:top_k]]
+            if cache_on:
+                _RECALL_CACHE.put(
+                    user_id,
+                    cache_key,
+                    q_emb,
+                    results,
+                    generation=generation,
+                    capacity=settings.RECALL_SEMANTIC_CACHE_SIZE,
+                )
+            return results
         except MemoryUnprocessableException:
             raise
         except Exception as exc:
@@ -537,6 +708,7 @@ class MemoryService:
             if n == 0:
                 raise MemoryUnprocessableException("memory_not_found")
             await session.commit()
+            invalidate_recall_cache(user_id)
         except MemoryUnprocessableException:
             await session.rollback()
             raise
@@ -651,7 +823,21 @@ class MemoryService:
                 session, user_id=user_id, ids=ids
             )
             await session.commit()
+            invalidate_recall_cache(user_id)
             return deleted
         except Exception as exc:
             await session.rollback()
             raise MemoryServiceException("Failed to delete memory", str(exc)) from exc
+
+
+# Built on first use (loads the embedding model), then shared by the memory
+# API and the voice loop so the model is only held once per process.
+_SERVICE: MemoryService | None = None
+
+
+def get_memory_service() -> MemoryService:
+    global _SERVICE
+    svc = _SERVICE
+    if svc is None:
+        svc = _SERVICE = MemoryService.create()
+    return svc
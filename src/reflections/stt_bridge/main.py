@@ -1,10 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
-import subprocess
-import tempfile
-from pathlib import Path
 from typing import Annotated
 
 from fastapi import FastAPI, File, HTTPException, UploadFile
@@ -18,19 +16,20 @@ class TranscribeResponse(BaseModel):
 app = FastAPI(title="Reflections STT Bridge", version="0.1.0")
 
 
-_TS_RE = re.compile(r"^\\[[0-9:.]+\\s+-->\\s+[0-9:.]+\\]\\s*")
+# Leading "[00:00:00.000 --> 00:00:02.000]" segment timestamp.
+_TS_RE = re.compile(r"^\[[0-9:.]+\s+-->\s+[0-9:.]+\]\s*")
 
 
-def _clean_whisper_stdout(text: str) -> str:
-    lines: list[str] = []
-    for raw in text.splitlines():
-        s = raw.strip()
-        if not s:
-            continue
+def _clean_line(raw: str) -> str:
+    s = raw.strip()
+    # Most lines carry no timestamp (we pass -nt); skip the regex for them.
+    if s[:1] == "[":
         s = _TS_RE.sub("", s).strip()
-        if s:
-            lines.append(s)
-    return " ".join(lines).strip()
+    return s
+
+
+def _clean_whisper_stdout(text: str) -> str:
+    return " ".join(filter(None, map(_clean_line, text.splitlines())))
 
 
 @app.post("/transcribe", response_model=TranscribeResponse)
@@ -54,53 +53,37 @@ async def transcribe(audio: Annotated[UploadFile, File(...)]) -> TranscribeRespo
     if not data:
         raise HTTPException(status_code=400, detail="Empty audio file")
 
-    with tempfile.TemporaryDirectory() as td:
-        td_path = Path(td)
-        in_wav = td_path / "audio.wav"
-        out_base = td_path / "out"
-        in_wav.write_bytes(data)
-
-        # whisper.cpp writes transcription to stdout, and optionally to files.
-        # We rely on stdout to avoid parsing timestamps from SRT/VTT.
-        cmd = [
+    # whisper.cpp reads the audio from stdin (`-f -`) and writes the
+    # transcription to stdout, so nothing touches disk. We rely on stdout to
+    # avoid parsing timestamps from SRT/VTT. The subprocess is awaited, so the
+    # bridge keeps serving other requests while whisper runs.
+    try:
+        proc = await asyncio.create_subprocess_exec(
             whisper_bin,
             "-m",
             str(model_path),
             "-f",
-            str(in_wav),
+            "-",
             "-nt",  # no timestamps (supported by whisper.cpp CLI)
-            "-pp",  # print progress? harmless if ignored
-            "-of",
-            str(out_base),
-        ]
-
-        try:
-            proc = subprocess.run(
-                cmd,
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError as exc:
-            raise HTTPException(
-                status_code=500, detail=f"WHISPER_CPP_BIN not found: {whisper_bin}"
-            ) from exc
-
-        stdout = (proc.stdout or "").strip()
-        stderr = (proc.stderr or "").strip()
-        if proc.returncode != 0:
-            raise HTTPException(
-                status_code=500,
-                detail=f"whisper.cpp failed rc={proc.returncode}: {stderr[:200]}",
-            )
-
-        cleaned = _clean_whisper_stdout(stdout)
-        if cleaned:
-            return TranscribeResponse(text=cleaned)
-
-        # Fallback: read generated txt file if present.
-        txt_path = out_base.with_suffix(".txt")
-        if txt_path.exists():
-            return TranscribeResponse(text=txt_path.read_text().strip())
-
-        raise HTTPException(status_code=500, detail="No transcription produced")
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(
+            status_code=500, detail=f"WHISPER_CPP_BIN not found: {whisper_bin}"
+        ) from exc
+    out, err = await proc.communicate(data)
+
+    if proc.returncode != 0:
+        stderr = err.decode(errors="replace").strip()
+        raise HTTPException(
+            status_code=500,
+            detail=f"whisper.cpp failed rc={proc.returncode}: {stderr[:200]}",
+        )
+
+    cleaned = _clean_whisper_stdout(out.decode(errors="replace"))
+    if cleaned:
+        return TranscribeResponse(text=cleaned)
+
+    raise HTTPException(status_code=500, detail="No transcription produced")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import asyncio
 import os
-import subprocess
 import tempfile
 from pathlib import Path
 
@@ -18,6 +18,23 @@ class SpeakRequest(BaseModel):
 app = FastAPI(title="Reflections TTS Bridge", version="0.1.0")
 
 
+async def _run(cmd: list[str], *, stdin: bytes | None = None) -> tuple[int, str]:
+    """
+    Run a command without blocking the event loop; returns (returncode, stderr).
+    """
+    stdin_mode = asyncio.subprocess.PIPE
+    if stdin is None:
+        stdin_mode = asyncio.subprocess.DEVNULL
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=stdin_mode,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _out, err = await proc.communicate(stdin)
+    return int(proc.returncode or 0), err.decode(errors="replace")
+
+
 def _piper_models_dir() -> Path | None:
     """
     Best-effort directory containing Piper .onnx models.
@@ -96,8 +113,9 @@ async def speak(req: SpeakRequest) -> Response:
     """
     Host-run TTS bridge.
 
-    Default implementation uses macOS `say` to synthesize speech, then converts
-    to PCM16 WAV via `afconvert` so the browser can play it via WebAudio.
+    Default implementation uses macOS `say` to synthesize speech straight to
+    16kHz PCM16 WAV so the browser can play it via WebAudio. Piper output is
+    converted to the same format via `afconvert`.
 
     Env vars:
     - TTS_VOICE: optional default voice name (macOS voices)
@@ -114,7 +132,6 @@ async def speak(req: SpeakRequest) -> Response:
 
     with tempfile.TemporaryDirectory() as td:
         td_path = Path(td)
-        aiff_path = td_path / "out.aiff"
         piper_wav_path = td_path / "piper.wav"
         wav_path = td_path / "out.wav"
 
@@ -141,55 +158,49 @@ async def speak(req: SpeakRequest) -> Response:
             if speaker:
                 cmd += ["--speaker", speaker]
 
-            proc = subprocess.run(
-                cmd,
-                input=req.text,
-                capture_output=True,
-                text=True,
-            )
-            if proc.returncode != 0:
+            rc, stderr = await _run(cmd, stdin=req.text.encode())
+            if rc != 0:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"piper failed rc={rc}: {stderr[:200]}",
+                )
+
+            # Convert to 16kHz mono PCM16 WAV
+            conv_cmd = [
+                "afconvert",
+                "-f",
+                "WAVE",
+                "-d",
+                "LEI16@16000",
+                str(piper_wav_path),
+                str(wav_path),
+            ]
+            rc, stderr = await _run(conv_cmd)
+            if rc != 0:
                 raise HTTPException(
                     status_code=500,
-                    detail=(
-                        f"piper failed rc={proc.returncode}: "
-                        f"{(proc.stderr or '')[:200]}"
-                    ),
+                    detail=f"afconvert failed rc={rc}: {stderr[:200]}",
                 )
         else:
-            say_cmd = ["say", "-o", str(aiff_path)]
+            # `say` encodes 16kHz mono PCM16 WAV itself, so there's no
+            # intermediate AIFF and no afconvert pass.
+            say_cmd = [
+                "say",
+                "--file-format=WAVE",
+                "--data-format=LEI16@16000",
+                "-o",
+                str(wav_path),
+            ]
             if voice:
                 say_cmd += ["-v", voice]
             say_cmd.append(req.text)
 
-            proc = subprocess.run(say_cmd, capture_output=True, text=True)
-            if proc.returncode != 0:
+            rc, stderr = await _run(say_cmd)
+            if rc != 0:
                 raise HTTPException(
                     status_code=500,
-                    detail=(
-                        f"say failed rc={proc.returncode}: {(proc.stderr or '')[:200]}"
-                    ),
+                    detail=f"say failed rc={rc}: {stderr[:200]}",
                 )
 
-        # Convert to 16kHz mono PCM16 WAV
-        src_path = piper_wav_path if engine == "piper" else aiff_path
-        conv_cmd = [
-            "afconvert",
-            "-f",
-            "WAVE",
-            "-d",
-            "LEI16@16000",
-            str(src_path),
-            str(wav_path),
-        ]
-        proc2 = subprocess.run(conv_cmd, capture_output=True, text=True)
-        if proc2.returncode != 0:
-            raise HTTPException(
-                status_code=500,
-                detail=(
-                    f"afconvert failed rc={proc2.returncode}: "
-                    f"{(proc2.stderr or '')[:200]}"
-                ),
-            )
-
         wav_bytes = wav_path.read_bytes()
         return Response(content=wav_bytes, media_type="audio/wav")
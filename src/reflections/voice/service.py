@@ -6,7 +6,6 @@ import json
 import time
 from array import array
 from dataclasses import dataclass, field
-from functools import lru_cache
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect  # type: ignore[import-not-found]
@@ -18,7 +17,7 @@ from reflections.core.db import database_manager
 from reflections.core.settings import settings
 from reflections.conversations.service import get_conversations_service
 from reflections.memory.schemas import Turn
-from reflections.memory.service import MemoryService
+from reflections.memory.service import get_memory_service
 from reflections.voice.exceptions import VoiceServiceException
 from reflections.voice.repository import VoiceRepository
 from reflections.voice.schemas import (
@@ -98,11 +97,6 @@ def build_done_message() -> ServerDone:
 _client_msg_adapter = TypeAdapter(ClientMessage)
 
 
-@lru_cache
-def get_memory_service() -> MemoryService:
-    return MemoryService.create()
-
-
 def should_store_turns(turns: list[Turn]) -> bool:
     # Basic guardrails v0: skip empty/placeholder audio.
     joined = " ".join(t.content.strip() for t in turns if t.content)
@@ -7,6 +7,7 @@ from uuid import UUID
 import pytest  # type: ignore[import-not-found]
 
 from reflections.auth.models import User
+from reflections.auth.repository import UserAuthRow
 from reflections.auth.service import AuthService
 
 
@@ -24,6 +25,12 @@ class FakeRepo:
                 return u
         return None
 
+    async def get_user_auth_row(self, _session, *, email: str) -> UserAuthRow | None:
+        u = await self.get_user_by_email(_session, email=email)
+        if u is None:
+            return None
+        return UserAuthRow._make(getattr(u, f) for f in UserAuthRow._fields)
+
     async def get_user_by_id(self, _session, *, user_id: UUID) -> User | None:
         for u in self.inserted:
             if u.id == user_id:
@@ -98,3 +105,33 @@ async def test_second_signup_is_not_admin() -> None:
     )
 
     assert user.is_admin is False
+
+
+@pytest.mark.anyio
+async def test_login_returns_plain_row_with_last_login() -> None:
+    @dataclass
+    class LoginRepo(FakeRepo):
+        async def touch_last_login(
+            self, _session, *, user_id: UUID, at: dt.datetime
+        ) -> None:
+            return None
+
+    repo = LoginRepo(user_count=0)
+    svc = AuthService(repo=repo)  # type: ignore[arg-type]
+    await svc.signup(
+        FakeSession(),  # type: ignore[arg-type]
+        email="login@example.com",
+        name="Login",
+        password="hunter2hunter2",
+    )
+
+    user, token = await svc.login(
+        FakeSession(),  # type: ignore[arg-type]
+        email="LOGIN@example.com",
+        password="hunter2hunter2",
+    )
+
+    assert isinstance(user, UserAuthRow)
+    assert user.email == "login@example.com"
+    assert user.last_login_at is not None
+    assert token
@@ -34,7 +34,7 @@ def test_avatars_generate_image_updates_avatar(client, monkeypatch):  # type: ig
         ):
             assert str(avatar_id) == str(aid)
             assert engine == "diffusers_sdxl"
-            return "data:image/png;base64,AAA"
+            return f"/avatars/{avatar_id}/image?v=1"
 
     client.app.dependency_overrides[avatars_api.get_avatars_service] = lambda: FakeSvc()
 
@@ -55,6 +55,37 @@ def test_avatars_generate_image_updates_avatar(client, monkeypatch):  # type: ig
 
     # Assert
     assert r.status_code == 200
-    assert r.json()["image_url"].startswith("data:image/png;base64,")
+    assert r.json()["image_url"] == f"/avatars/{avatar_id}/image?v=1"
 
 
+def test_avatars_get_image_serves_binary(client):  # type: ignore[no-untyped-def]
+    from reflections.auth.depends import current_user_required
+    from reflections.avatars import api as avatars_api
+    from reflections.commons import depends as commons_depends
+
+    class FakeUser:
+        id = UUID("00000000-0000-0000-0000-000000000001")
+        active_avatar_id = None
+
+    async def fake_db_session():  # type: ignore[no-untyped-def]
+        yield None
+
+    class FakeImage:
+        content_type = "image/png"
+        data = b"\x89PNG\r\n\x1a\nfake"
+
+    class FakeSvc:
+        async def get_image(self, session, *, user, avatar_id):  # type: ignore[no-untyped-def]
+            return FakeImage() if avatar_id.int == 2 else None
+
+    client.app.dependency_overrides[current_user_required] = lambda: FakeUser()
+    client.app.dependency_overrides[commons_depends.database_session] = fake_db_session
+    client.app.dependency_overrides[avatars_api.get_avatars_service] = lambda: FakeSvc()
+
+    r = client.get("/avatars/00000000-0000-0000-0000-000000000002/image")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "image/png"
+    assert r.content == FakeImage.data
+
+    missing = client.get("/avatars/00000000-0000-0000-0000-000000000003/image")
+    assert missing.status_code == 404
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from reflections.commons.ids import uuid7_uuid
+
+
+def test_uuid7_uuid_is_version_7() -> None:
+    assert uuid7_uuid().version == 7
+
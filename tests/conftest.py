@@ -6,6 +6,8 @@ add heavier fixtures only when we actually introduce DB/cache/background tasks.
 """
 
 import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
 
 import pytest  # type: ignore[import-not-found]
 from fastapi import FastAPI
@@ -39,3 +41,79 @@ def client(app: FastAPI) -> TestClient:
 def anyio_backend() -> str:
     """Default AnyIO backend for async tests."""
     return "asyncio"
+
+
+class FakeResult:
+    """Minimal Result stand-in: ``rows`` back all()/one()/scalar_one()."""
+
+    def __init__(self, rows: list[tuple] | None = None, rowcount: int = 0) -> None:
+        self.rows = rows or []
+        self.rowcount = rowcount
+
+    def all(self) -> list[tuple]:
+        return self.rows
+
+    def one(self) -> tuple:
+        return self.rows[0]
+
+    def scalar_one(self) -> Any:
+        return self.rows[0][0]
+
+
+class FakeDbSession:
+    """
+    AsyncSession stand-in for repository unit tests (no DB).
+
+    execute() records (statement, params) and returns the next result queued
+    with add_result() (an empty one once the queue runs out). It also plays the raw
+    psycopg connection/cursor/copy chain, so COPY paths record their SQL and
+    rows in ``copy_sql`` and ``copied``.
+    """
+
+    def __init__(self) -> None:
+        self.results: list[FakeResult] = []
+        self.executed: list[tuple[Any, Any]] = []
+        self.copy_sql: list[str] = []
+        self.copied: list[tuple] = []
+
+    def add_result(self, rows: list[tuple] | None = None, rowcount: int = 0) -> None:
+        self.results.append(FakeResult(rows, rowcount))
+
+    async def execute(self, stmt: Any, params: Any = None) -> FakeResult:
+        self.executed.append((stmt, params))
+        return self.results.pop(0) if self.results else FakeResult()
+
+    async def flush(self) -> None:
+        return None
+
+    async def commit(self) -> None:
+        return None
+
+    # session.connection() -> get_raw_connection() -> driver_connection
+    async def connection(self) -> "FakeDbSession":
+        return self
+
+    async def get_raw_connection(self) -> "FakeDbSession":
+        return self
+
+    @property
+    def driver_connection(self) -> "FakeDbSession":
+        return self
+
+    @asynccontextmanager
+    async def cursor(self):  # type: ignore[no-untyped-def]
+        yield self
+
+    @asynccontextmanager
+    async def copy(self, sql: str):  # type: ignore[no-untyped-def]
+        self.copy_sql.append(sql)
+        yield self
+
+    async def write_row(self, row: tuple) -> None:
+        self.copied.append(tuple(row))
+
+
+@pytest.fixture()
+def fake_db_session() -> FakeDbSession:
+    """Fake AsyncSession (incl. raw COPY) for repository unit tests."""
+    return FakeDbSession()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from uuid import UUID
 
 
@@ -28,7 +28,7 @@ def test_conversations_list_smoke(client):  # type: ignore[no-untyped-def]
         id = UUID("22222222-2222-2222-2222-222222222222")
         user_id = FakeUser.id
         avatar_id = None
-        created_at = datetime.now(timezone.utc)
+        created_at = datetime.now(UTC)
         updated_at = created_at
 
     class FakeSvc:
@@ -83,6 +83,9 @@ def test_conversations_get_not_found(client):  # type: ignore[no-untyped-def]
 
     r = client.get("/conversations/33333333-3333-3333-3333-333333333333")
     assert r.status_code == 404
+    assert client.get("/conversations/not-a-uuid").status_code == 404
+    r = client.get("/conversations/3333333333333333333333333333333g")
+    assert r.status_code == 404
 
 
 def test_conversations_recent_returns_turns(client):  # type: ignore[no-untyped-def]
@@ -175,3 +178,52 @@ def test_conversations_recent_empty_when_no_history(client):  # type: ignore[no-
     assert body["turns"] == []
 
 
+def test_conversations_turns_ndjson_streams_one_turn_per_line(client):  # type: ignore[no-untyped-def]
+    import json
+
+    from reflections.auth.depends import current_user_required
+    from reflections.commons import depends as commons_depends
+    from reflections.conversations import api as conversations_api
+    from reflections.conversations.repository import TurnRow
+
+    class FakeUser:
+        id = UUID("11111111-1111-1111-1111-111111111111")
+
+    client.app.dependency_overrides[current_user_required] = lambda: FakeUser()
+
+    async def fake_db_session():  # type: ignore[no-untyped-def]
+        yield None
+
+    client.app.dependency_overrides[commons_depends.database_session] = fake_db_session
+
+    cid = UUID("22222222-2222-2222-2222-222222222222")
+    now = datetime.now(UTC)
+
+    class FakeSvc:
+        async def stream_turns(self, session, *, user, conversation_id):  # type: ignore[no-untyped-def]
+            assert conversation_id == cid
+
+            async def _rows():  # type: ignore[no-untyped-def]
+                for seq, role in enumerate(("user", "assistant")):
+                    yield TurnRow(
+                        id=UUID(int=seq + 1),
+                        conversation_id=cid,
+                        seq=seq,
+                        role=role,
+                        content=f"turn {seq}",
+                        created_at=now,
+                    )
+
+            return _rows()
+
+    client.app.dependency_overrides[conversations_api.get_conversations_service] = (
+        lambda: FakeSvc()
+    )
+
+    r = client.get(f"/conversations/{cid}/turns.ndjson")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert [t["seq"] for t in lines] == [0, 1]
+    assert lines[1]["role"] == "assistant"
+    assert lines[0]["conversation_id"] == str(cid)
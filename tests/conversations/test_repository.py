@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from reflections.conversations import repository
+
+
+async def test_append_turns_bulk_switches_to_copy_for_large_batches(
+    anyio_backend: str, fake_db_session
+) -> None:  # type: ignore[no-untyped-def]
+    fake_db_session.add_result(rows=[(7,)])  # next free seq
+    cid = uuid4()
+    n = repository._BULK_COPY_MIN_ROWS
+    turns = [("user" if i % 2 == 0 else "assistant", f"t{i}") for i in range(n)]
+    seq0 = await repository.ConversationsRepository().append_turns_bulk(
+        fake_db_session, conversation_id=cid, turns=turns
+    )
+    assert seq0 == 7
+    assert fake_db_session.copy_sql[0].startswith("COPY conversation_turns")
+    assert len(fake_db_session.copied) == n
+    assert fake_db_session.copied[0] == (cid, 7, "user", "t0")
+    assert fake_db_session.copied[-1] == (cid, 7 + n - 1, "assistant", f"t{n - 1}")
+    # Next-seq lookup, then the conversation touch; no INSERT statement.
+    assert len(fake_db_session.executed) == 2
@@ -6,3 +6,27 @@ async def test_get_health_payload_shape(anyio_backend: str) -> None:
     assert payload["status"] in ("ok", "degraded", "error")
     assert isinstance(payload["ollama_base_url"], str)
     assert "db" in payload
+
+
+async def test_get_health_payload_reuses_probes_within_ttl(
+    anyio_backend: str, monkeypatch
+) -> None:  # type: ignore[no-untyped-def]
+    calls = {"n": 0}
+
+    async def fake_check_db():  # type: ignore[no-untyped-def]
+        calls["n"] += 1
+        return True, None
+
+    async def fake_not_configured():  # type: ignore[no-untyped-def]
+        return False, "not_configured"
+
+    monkeypatch.setattr(service.repository, "check_db", fake_check_db)
+    for name in ("check_ollama", "check_stt", "check_tts", "check_a1111"):
+        monkeypatch.setattr(service.repository, name, fake_not_configured)
+    monkeypatch.setattr(service.settings, "HEALTH_CACHE_TTL_S", 60.0)
+    monkeypatch.setattr(service, "_cached", None)
+
+    first = await service.get_health_payload()
+    second = await service.get_health_payload()
+    assert first is second
+    assert calls["n"] == 1
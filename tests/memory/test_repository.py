@@ -1,4 +1,9 @@
+from uuid import uuid4
+
+import numpy as np  # type: ignore[import-not-found]
 import sqlalchemy as sa  # type: ignore[import-not-found]
+from pgvector.sqlalchemy import Vector  # type: ignore[import-not-found]
+from sqlalchemy.dialects import postgresql  # type: ignore[import-not-found]
 
 from reflections.memory import repository
 
@@ -12,3 +17,67 @@ def test_repository_search_builds_inner_product_order() -> None:
     compiled = str(stmt.compile(compile_kwargs={"literal_binds": True}))
     assert "<#>" in compiled
     assert "LIMIT 5" in compiled
+
+
+async def test_vector_candidates_binds_query_embedding(
+    anyio_backend: str, fake_db_session
+) -> None:  # type: ignore[no-untyped-def]
+    out = await repository.MemoryRepository().vector_candidates(
+        fake_db_session,
+        user_id=uuid4(),
+        avatar_id=None,
+        query_embedding=[0.1] * repository.EMBEDDING_DIM,
+        limit=50,
+        include_user_scope=True,
+        include_avatar_scope=False,
+        include_cards=True,
+        include_chunks=True,
+    )
+    assert out == []
+    (ef_stmt, ef_params), (stmt, _) = fake_db_session.executed
+    assert "hnsw.ef_search" in str(ef_stmt)
+    assert ef_params == {"ef": "200"}
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "<#>" in sql
+    # The embedding travels as a bound parameter, never inlined into the SQL.
+    assert "0.1" not in sql
+    assert any(v == [0.1] * repository.EMBEDDING_DIM for v in compiled.params.values())
+
+
+async def test_update_content_binds_embedding_as_vector(
+    anyio_backend: str, fake_db_session
+) -> None:  # type: ignore[no-untyped-def]
+    fake_db_session.add_result(rowcount=1)
+    n = await repository.MemoryRepository().update_content(
+        fake_db_session,
+        user_id=uuid4(),
+        memory_id=uuid4(),
+        content="x",
+        embedding=[0.5, 0.25],
+    )
+    assert n == 1
+    compiled = fake_db_session.executed[0][0].compile(dialect=postgresql.dialect())
+    assert "::vector" not in str(compiled)
+    assert isinstance(compiled.binds["embedding"].type, Vector)
+    assert compiled.params["embedding"] == [0.5, 0.25]
+
+
+async def test_insert_items_bulk_switches_to_copy_for_large_batches(
+    anyio_backend: str, fake_db_session
+) -> None:  # type: ignore[no-untyped-def]
+    n = repository._BULK_COPY_MIN_ROWS
+    items = [
+        ("user", "chunk", f"c{i}", np.array([0.5, 0.25], dtype=np.float32))
+        for i in range(n)
+    ]
+    ids = await repository.MemoryRepository().insert_items_bulk(
+        fake_db_session,
+        user_id=uuid4(),
+        avatar_id=None,
+        items=items,  # type: ignore[arg-type]
+    )
+    assert len(ids) == n
+    assert fake_db_session.copy_sql[0].startswith("COPY memory_items")
+    assert [r[0] for r in fake_db_session.copied] == ids
+    assert fake_db_session.copied[0][5:] == ("c0", "[0.5,0.25]")
@@ -43,3 +43,160 @@ def test_extract_memory_cards_heuristic_is_conservative() -> None:
     cards = extract_memory_cards_heuristic(turns)
     assert any("prefer" in c.lower() for c in cards)
     assert any("apple silicon" in c.lower() for c in cards)
+
+
+async def test_ingest_episodic_embeds_cards_and_chunks_in_one_batch(
+    anyio_backend: str, fake_db_session
+) -> None:  # type: ignore[no-untyped-def]
+    from uuid import uuid4
+
+    import numpy as np  # type: ignore[import-not-found]
+
+    from reflections.memory.service import MemoryService
+
+    calls: list[list[str]] = []
+
+    class FakeEmbedder:
+        def encode(self, texts, **_kw):  # type: ignore[no-untyped-def]
+            calls.append(list(texts))
+            return np.ones((len(texts), 3), dtype=np.float32)
+
+    inserted: list[tuple[str, str]] = []
+
+    class FakeRepo:
+        async def insert_items_bulk(self, _session, *, items, **_kw):  # type: ignore[no-untyped-def]
+            inserted.extend((kind, content) for _scope, kind, content, _emb in items)
+            return [uuid4() for _ in items]
+
+    svc = MemoryService(repository=FakeRepo(), embedder=FakeEmbedder())  # type: ignore[arg-type]
+    turns = [
+        Turn(role="user", content="I prefer tea."),
+        Turn(role="user", content="We will visit Oslo."),
+    ]
+    _ids, n_cards, n_chunks = await svc.ingest_episodic(
+        fake_db_session,
+        user_id=uuid4(),
+        avatar_id=None,
+        turns=turns,
+        chunk_turn_window=2,
+    )
+    assert (n_cards, n_chunks) == (2, 1)
+    # One encode call and one INSERT covering every card and chunk, in order.
+    assert calls == [[content for _kind, content in inserted]]
+    assert [kind for kind, _content in inserted] == ["card", "card", "chunk"]
+
+
+def test_embed_texts_serves_repeats_from_cache() -> None:
+    import numpy as np  # type: ignore[import-not-found]
+
+    from reflections.memory.service import MemoryService
+
+    calls: list[list[str]] = []
+
+    class FakeEmbedder:
+        def encode(self, texts, **_kw):  # type: ignore[no-untyped-def]
+            calls.append(list(texts))
+            return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+    svc = MemoryService(repository=None, embedder=FakeEmbedder())  # type: ignore[arg-type]
+    assert svc.embed_text("hello").tolist() == [5.0]
+    assert [v.tolist() for v in svc.embed_texts(["hello", "hi"])] == [[5.0], [2.0]]
+    # Only the miss ("hi") went back to the model.
+    assert calls == [["hello"], ["hi"]]
+
+
+async def test_search_semantic_cache_hits_until_user_writes(
+    anyio_backend: str, monkeypatch
+) -> None:  # type: ignore[no-untyped-def]
+    from uuid import uuid4
+
+    import numpy as np  # type: ignore[import-not-found]
+
+    from reflections.core.settings import settings
+    from reflections.memory.service import MemoryService, invalidate_recall_cache
+
+    monkeypatch.setattr(settings, "RECALL_SEMANTIC_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "RECALL_SEMANTIC_CACHE_THRESHOLD", 0.95)
+
+    vectors = {
+        "where do I live": [1.0, 0.0],
+        "where do i live?": [0.99, 0.141],
+        "favourite food": [0.0, 1.0],
+    }
+
+    class FakeEmbedder:
+        def encode(self, texts, **_kw):  # type: ignore[no-untyped-def]
+            return np.array([vectors[t] for t in texts], dtype=np.float32)
+
+    class FakeRepo:
+        calls = 0
+
+        async def vector_candidates(self, _session, **_kw):  # type: ignore[no-untyped-def]
+            FakeRepo.calls += 1
+            return []
+
+    svc = MemoryService(repository=FakeRepo(), embedder=FakeEmbedder())  # type: ignore[arg-type]
+    user_id = uuid4()
+
+    async def search(query: str) -> None:
+        await svc.search(
+            None,  # type: ignore[arg-type]
+            user_id=user_id,
+            avatar_id=None,
+            query=query,
+            top_k=5,
+            include_user_scope=True,
+            include_avatar_scope=False,
+            include_cards=True,
+            include_chunks=True,
+            hybrid_enabled=False,
+            rerank_enabled=False,
+            decay_enabled=False,
+        )
+
+    await search("where do I live")
+    await search("where do i live?")  # cosine ~0.99: served from cache
+    assert FakeRepo.calls == 1
+    await search("favourite food")  # dissimilar: goes to the repository
+    assert FakeRepo.calls == 2
+    invalidate_recall_cache(user_id)
+    await search("where do I live")
+    assert FakeRepo.calls == 3
+
+
+def test_extract_memory_cards_heuristic_matches_needles_case_insensitively() -> None:
+    turns = [
+        Turn(role="user", content="MY dog is called Rex. The weather is nice."),
+        Turn(role="user", content="I'm\nfrom Oslo. Nothing here."),
+    ]
+    cards = extract_memory_cards_heuristic(turns)
+    assert cards == ["MY dog is called Rex", "I'm from Oslo"]
+
+
+def test_create_selects_onnx_backend_and_file(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from reflections.core.settings import settings
+    from reflections.memory import service
+
+    seen: list[tuple[str, dict]] = []
+
+    def fake_sentence_transformer(model_id, **kwargs):  # type: ignore[no-untyped-def]
+        seen.append((model_id, kwargs))
+        return object()
+
+    monkeypatch.setattr(service, "SentenceTransformer", fake_sentence_transformer)
+    monkeypatch.setattr(settings, "MEMORY_EMBEDDING_BACKEND", "onnx")
+    monkeypatch.setattr(
+        settings, "MEMORY_EMBEDDING_ONNX_FILE", "onnx/model_qint8_avx512_vnni.onnx"
+    )
+
+    service.MemoryService.create()
+
+    assert seen == [
+        (
+            service.EMBEDDING_MODEL_ID,
+            {
+                "backend": "onnx",
+                "model_kwargs": {"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+            },
+        )
+    ]
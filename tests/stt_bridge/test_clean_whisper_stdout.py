@@ -0,0 +1,15 @@
+from reflections.stt_bridge.main import _clean_whisper_stdout
+
+
+def test_strips_segment_timestamps() -> None:
+    out = (
+        "[00:00:00.000 --> 00:00:02.000]   Hello there.\n"
+        "[00:00:02.000 --> 00:00:03.500] How are you?\n"
+    )
+    assert _clean_whisper_stdout(out) == "Hello there. How are you?"
+
+
+def test_joins_plain_lines_and_drops_blanks() -> None:
+    assert _clean_whisper_stdout("\n  Hello there.  \n\n[BLANK_AUDIO]\n") == (
+        "Hello there. [BLANK_AUDIO]"
+    )